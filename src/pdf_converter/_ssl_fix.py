@@ -4,50 +4,69 @@ Import this module before any network calls to ensure SSL works
 behind corporate proxies with Zscaler certificate inspection.
 """
 
+import functools
 import os
+import re
 import sys
 import shutil
 import base64
 from pathlib import Path
 
+_COMBINED_BUNDLE = Path(__file__).parent / "_combined-ca-bundle.pem"
+_SSL_ENV_VARS = ("SSL_CERT_FILE", "REQUESTS_CA_BUNDLE", "CURL_CA_BUNDLE")
 
+
+def _export_bundle(bundle: Path) -> None:
+    """Point the SSL env vars at the combined bundle."""
+    bundle_str = str(bundle)
+    for var in _SSL_ENV_VARS:
+        os.environ[var] = bundle_str
+
+
+@functools.lru_cache(maxsize=1)
 def setup_ssl():
-    """Create a combined CA bundle with certifi roots + decoded Zscaler cert."""
-    zscaler_pem = Path(os.path.expanduser("~")) / "zscaler-root-new.pem"
-    if not zscaler_pem.exists():
-        return  # No Zscaler cert found, skip
+    """Create a combined CA bundle with certifi roots + decoded Zscaler cert.
 
-    combined = Path(__file__).parent / "_combined-ca-bundle.pem"
+    Memoized: repeat in-process calls (e.g. test harnesses re-importing the
+    package) are free, and a bundle already exported via env vars is trusted
+    without re-statting the filesystem.
+    """
+    if os.environ.get("SSL_CERT_FILE", "").endswith("_combined-ca-bundle.pem"):
+        return  # Bundle already active (e.g. set by a parent process)
+
+    combined = _COMBINED_BUNDLE
     if combined.exists():
-        # Already created — just set env vars
-        combined_str = str(combined)
-        os.environ["SSL_CERT_FILE"] = combined_str
-        os.environ["REQUESTS_CA_BUNDLE"] = combined_str
-        os.environ["CURL_CA_BUNDLE"] = combined_str
+        # Already created — just set env vars (skips the Zscaler stat entirely)
+        _export_bundle(combined)
         return
 
+    zscaler_pem = Path.home() / "zscaler-root-new.pem"
+    if not zscaler_pem.exists():
+        return  # No Zscaler cert found, skip
+
     try:
         import certifi
 
-        # Read and decode the double-encoded Zscaler cert
+        # Read and decode the double-encoded Zscaler cert: strip the PEM
+        # armour lines and all whitespace in one C-level regex pass.
         raw = zscaler_pem.read_text()
-        lines = raw.strip().splitlines()
-        b64 = "".join(l.strip() for l in lines if not l.startswith("-----"))
+        b64 = re.sub(r"-----[^\n]*-----|\s+", "", raw)
         real_cert = base64.b64decode(b64).decode("utf-8")
 
-        # Combine certifi bundle + decoded Zscaler cert
+        # Combine certifi bundle + decoded Zscaler cert (single buffer, one write)
         certifi_bundle = Path(certifi.where()).read_text()
         combined.write_text(
-            certifi_bundle.rstrip()
-            + "\n\n# Zscaler Root CA\n"
-            + real_cert.strip()
-            + "\n"
+            "".join(
+                [
+                    certifi_bundle.rstrip(),
+                    "\n\n# Zscaler Root CA\n",
+                    real_cert.strip(),
+                    "\n",
+                ]
+            )
         )
 
-        combined_str = str(combined)
-        os.environ["SSL_CERT_FILE"] = combined_str
-        os.environ["REQUESTS_CA_BUNDLE"] = combined_str
-        os.environ["CURL_CA_BUNDLE"] = combined_str
+        _export_bundle(combined)
     except Exception as e:
         print(f"  Warning: Could not set up combined CA bundle: {e}", file=sys.stderr)
 
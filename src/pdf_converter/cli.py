@@ -11,12 +11,15 @@ from __future__ import annotations
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
 from pdf_converter.config import Config
 from pdf_converter.exceptions import PdfConverterError
-from pdf_converter.pipeline import Pipeline
+
+if TYPE_CHECKING:
+    from pdf_converter.pipeline import Pipeline
 
 
 @click.group()
@@ -31,6 +34,9 @@ from pdf_converter.pipeline import Pipeline
 @click.pass_context
 def main(ctx: click.Context, verbose: bool, config_path: Path | None) -> None:
     """PDF to Word converter for Polarion ALM import."""
+    # Deferred so `--help` doesn't pay the pipeline import chain
+    from pdf_converter.pipeline import Pipeline
+
     level = logging.DEBUG if verbose else logging.WARNING
     logging.basicConfig(
         level=level,
@@ -6,10 +6,11 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
 from pdf_converter.exceptions import ConfigError
 
+# yaml is imported lazily inside the from_yaml* classmethods — it costs
+# ~15 ms at import time and default-config paths never need it.
+
 
 @dataclass
 class StyleConfig:
@@ -42,6 +43,17 @@ class ParserConfig:
 
     engine: str = "docling"
     ocr_enabled: bool = True
+    # PNG zlib level for extracted figures (0-9). 1 encodes ~5x faster
+    # than PIL's default 6 at ~10% larger files — the .docx recompresses
+    # images anyway, so the size rarely matters.
+    image_compress_level: int = 1
+
+
+# Known field names per section, precomputed so _from_dict filters unknown
+# YAML keys without re-resolving __dataclass_fields__ per item.
+_STYLE_FIELDS = frozenset(StyleConfig.__dataclass_fields__)
+_IMAGE_FIELDS = frozenset(ImageConfig.__dataclass_fields__)
+_PARSER_FIELDS = frozenset(ParserConfig.__dataclass_fields__)
 
 
 @dataclass
@@ -56,6 +68,8 @@ class Config:
     @classmethod
     def from_yaml(cls, path: Path) -> Config:
         """Load configuration from a YAML file."""
+        import yaml
+
         try:
             text = path.read_text(encoding="utf-8")
             data = yaml.safe_load(text) or {}
@@ -69,6 +83,8 @@ class Config:
     @classmethod
     def from_yaml_string(cls, text: str) -> Config:
         """Load configuration from a YAML string."""
+        import yaml
+
         try:
             data = yaml.safe_load(text) or {}
         except yaml.YAMLError as exc:
@@ -82,9 +98,9 @@ class Config:
         parser_data = data.get("parser", {})
 
         return cls(
-            style=StyleConfig(**{k: v for k, v in style_data.items() if k in StyleConfig.__dataclass_fields__}),
-            image=ImageConfig(**{k: v for k, v in image_data.items() if k in ImageConfig.__dataclass_fields__}),
-            parser=ParserConfig(**{k: v for k, v in parser_data.items() if k in ParserConfig.__dataclass_fields__}),
+            style=StyleConfig(**{k: v for k, v in style_data.items() if k in _STYLE_FIELDS}),
+            image=ImageConfig(**{k: v for k, v in image_data.items() if k in _IMAGE_FIELDS}),
+            parser=ParserConfig(**{k: v for k, v in parser_data.items() if k in _PARSER_FIELDS}),
             verbose=data.get("verbose", False),
         )
 
@@ -11,15 +11,16 @@ import base64
 import io
 import logging
 from pathlib import Path
-from typing import Optional
-
-from docx.document import Document
-from docx.shared import Inches
+from typing import TYPE_CHECKING, Optional
 
 from pdf_converter.config import ImageConfig
 from pdf_converter.exceptions import ImageError
 from pdf_converter.ir.schema import FigureBlock
 
+if TYPE_CHECKING:
+    from docx.document import Document
+    from docx.shared import Inches
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,22 +41,25 @@ def add_image(
         config: Image configuration (max dimensions, placeholder text).
         base_dir: Base directory for resolving relative image paths.
     """
-    image_stream = _load_image(block, base_dir)
+    data = _load_image_bytes(block, base_dir)
 
-    if image_stream is None:
+    if data is None:
         _add_placeholder(doc, config)
         return
 
-    width, height = _compute_dimensions(image_stream, block, config)
-    image_stream.seek(0)
+    width, height = _compute_dimensions(data, block, config)
 
-    doc.add_picture(image_stream, width=width, height=height)
+    doc.add_picture(io.BytesIO(data), width=width, height=height)
 
 
-def _load_image(
+def _load_image_bytes(
     block: FigureBlock, base_dir: Optional[Path]
-) -> Optional[io.BytesIO]:
-    """Load image bytes from path or base64."""
+) -> Optional[bytes]:
+    """Load raw image bytes from path or base64.
+
+    Returning bytes (rather than a stream) lets the dimension probe and
+    python-docx each wrap their own BytesIO without seek bookkeeping.
+    """
     # Try file path first
     if block.image_path:
         path = Path(block.image_path)
@@ -64,15 +68,14 @@ def _load_image(
 
         if path.exists():
             try:
-                return io.BytesIO(path.read_bytes())
+                return path.read_bytes()
             except OSError as exc:
                 logger.warning("Failed to read image %s: %s", path, exc)
 
     # Try base64 fallback
     if block.image_base64:
         try:
-            data = base64.b64decode(block.image_base64)
-            return io.BytesIO(data)
+            return base64.b64decode(block.image_base64)
         except Exception as exc:
             logger.warning("Failed to decode base64 image: %s", exc)
 
@@ -80,7 +83,7 @@ def _load_image(
 
 
 def _compute_dimensions(
-    image_stream: io.BytesIO,
+    data: bytes,
     block: FigureBlock,
     config: ImageConfig,
 ) -> tuple[Optional[Inches], Optional[Inches]]:
@@ -90,6 +93,8 @@ def _compute_dimensions(
     the image to get its native size, then scales down to fit
     within config.max_width_inches × config.max_height_inches.
     """
+    from docx.shared import Inches
+
     width_in = block.width_inches
     height_in = block.height_inches
 
@@ -97,14 +102,13 @@ def _compute_dimensions(
         try:
             from PIL import Image
 
-            image_stream.seek(0)
-            img = Image.open(image_stream)
-            dpi_x, dpi_y = img.info.get("dpi", (96, 96))
-            # Ensure DPI values are reasonable
-            dpi_x = max(dpi_x, 72)
-            dpi_y = max(dpi_y, 72)
-            width_in = img.width / dpi_x
-            height_in = img.height / dpi_y
+            with Image.open(io.BytesIO(data)) as img:
+                dpi_x, dpi_y = img.info.get("dpi", (96, 96))
+                # Ensure DPI values are reasonable
+                dpi_x = max(dpi_x, 72)
+                dpi_y = max(dpi_y, 72)
+                width_in = img.width / dpi_x
+                height_in = img.height / dpi_y
         except Exception:
             # Can't determine size — use max width, no height constraint
             return Inches(config.max_width_inches), None
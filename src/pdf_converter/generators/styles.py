@@ -6,14 +6,49 @@ and other Polarion-specific formatting concerns.
 
 from __future__ import annotations
 
+from copy import deepcopy
+
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsmap, qn
 from docx.shared import Pt
 
 from pdf_converter.config import StyleConfig
 
+# Clark-notation names resolved once — qn() re-derives the namespace URI
+# and allocates the braced string on every call, which adds up in the
+# per-run highlight path.
+_QN_VAL = qn("w:val")
+_QN_ILVL = qn("w:ilvl")
+_QN_NUMFMT = qn("w:numFmt")
+_QN_LVLTEXT = qn("w:lvlText")
+_QN_PPR = qn("w:pPr")
+_QN_IND = qn("w:ind")
+_QN_LEFT = qn("w:left")
+
+# Template for one <w:lvl> entry; per-level values (ilvl, numFmt, lvlText,
+# indent) are patched onto a deepcopy so each level costs one C-level copy
+# instead of ~10 OxmlElement constructions.
+_LVL_TEMPLATE = parse_xml(
+    f'<w:lvl xmlns:w="{nsmap["w"]}">'
+    '<w:start w:val="1"/>'
+    '<w:numFmt w:val="decimal"/>'
+    '<w:lvlText w:val=""/>'
+    '<w:lvlJc w:val="left"/>'
+    '<w:pPr><w:ind w:left="720" w:hanging="360"/></w:pPr>'
+    "</w:lvl>"
+)
+
+# (abstract_num_id, per-level numFmt values, per-level lvlText values)
+_NUMBERING_DEFS = [
+    # bullet, circle, square
+    ("100", ["bullet", "bullet", "bullet"], ["•", "○", "▪"]),
+    ("101", ["decimal", "lowerLetter", "lowerRoman"], ["%1.", "%2.", "%3."]),
+    ("102", ["lowerLetter", "lowerRoman", "decimal"], ["%1.", "%2.", "%3."]),
+    ("103", ["upperLetter", "upperRoman", "decimal"], ["%1.", "%2.", "%3."]),
+]
+
 
 def heading_style_name(config: StyleConfig, level: int) -> str:
     """Return the Word style name for a heading level (e.g. 'Heading 1')."""
@@ -44,209 +79,49 @@ def ensure_styles_exist(doc: Document, config: StyleConfig) -> None:
     numbering_part = doc.part.numbering_part
     numbering_elem = numbering_part._element
 
-    # Create bullet numbering definition
-    _create_bullet_numbering(numbering_elem)
-    # Create number numbering definition
-    _create_number_numbering(numbering_elem)
-    # Create letter numbering definitions
-    _create_lower_letter_numbering(numbering_elem)
-    _create_upper_letter_numbering(numbering_elem)
+    # Build all definitions first, then mutate the parent in two bulk ops
+    # (one child-list splice each) instead of eight individual inserts.
+    defs = [
+        _create_numbering(abstract_num_id, formats, texts)
+        for abstract_num_id, formats, texts in _NUMBERING_DEFS
+    ]
+    numbering_elem[:0] = [abstract_num for abstract_num, _ in defs]
+    numbering_elem.extend(num for _, num in defs)
 
 
-def _create_bullet_numbering(numbering_elem) -> None:
-    """Create an abstract numbering definition for bullets (3 levels)."""
-    bullet_chars = ["\u2022", "\u25CB", "\u25AA"]  # bullet, circle, square
-    abstract_num_id = "100"
+def _create_numbering(
+    abstract_num_id: str, formats: list[str], texts: list[str]
+):
+    """Build one abstract numbering definition (3 levels) plus its concrete num.
 
+    Returns:
+        Tuple of (abstractNum element, num element); the caller attaches both.
+    """
     abstract_num = OxmlElement("w:abstractNum")
     abstract_num.set(qn("w:abstractNumId"), abstract_num_id)
 
     for i in range(3):
-        lvl = OxmlElement("w:lvl")
-        lvl.set(qn("w:ilvl"), str(i))
-
-        start = OxmlElement("w:start")
-        start.set(qn("w:val"), "1")
-        lvl.append(start)
-
-        num_fmt = OxmlElement("w:numFmt")
-        num_fmt.set(qn("w:val"), "bullet")
-        lvl.append(num_fmt)
-
-        lvl_text = OxmlElement("w:lvlText")
-        lvl_text.set(qn("w:val"), bullet_chars[i])
-        lvl.append(lvl_text)
-
-        lvl_jc = OxmlElement("w:lvlJc")
-        lvl_jc.set(qn("w:val"), "left")
-        lvl.append(lvl_jc)
-
-        ppr = OxmlElement("w:pPr")
-        ind = OxmlElement("w:ind")
-        left = str(720 * (i + 1))
-        ind.set(qn("w:left"), left)
-        ind.set(qn("w:hanging"), "360")
-        ppr.append(ind)
-        lvl.append(ppr)
-
+        lvl = deepcopy(_LVL_TEMPLATE)
+        lvl.set(_QN_ILVL, str(i))
+        lvl.find(_QN_NUMFMT).set(_QN_VAL, formats[i])
+        lvl.find(_QN_LVLTEXT).set(_QN_VAL, texts[i])
+        lvl.find(_QN_PPR).find(_QN_IND).set(_QN_LEFT, str(720 * (i + 1)))
         abstract_num.append(lvl)
 
-    numbering_elem.insert(0, abstract_num)
-
     # Create concrete num referencing this abstract
     num = OxmlElement("w:num")
     num.set(qn("w:numId"), abstract_num_id)
     abstract_ref = OxmlElement("w:abstractNumId")
-    abstract_ref.set(qn("w:val"), abstract_num_id)
+    abstract_ref.set(_QN_VAL, abstract_num_id)
     num.append(abstract_ref)
-    numbering_elem.append(num)
-
-
-def _create_number_numbering(numbering_elem) -> None:
-    """Create an abstract numbering definition for ordered lists (3 levels)."""
-    formats = ["decimal", "lowerLetter", "lowerRoman"]
-    texts = ["%1.", "%2.", "%3."]
-    abstract_num_id = "101"
-
-    abstract_num = OxmlElement("w:abstractNum")
-    abstract_num.set(qn("w:abstractNumId"), abstract_num_id)
-
-    for i in range(3):
-        lvl = OxmlElement("w:lvl")
-        lvl.set(qn("w:ilvl"), str(i))
-
-        start = OxmlElement("w:start")
-        start.set(qn("w:val"), "1")
-        lvl.append(start)
 
-        num_fmt = OxmlElement("w:numFmt")
-        num_fmt.set(qn("w:val"), formats[i])
-        lvl.append(num_fmt)
+    return abstract_num, num
 
-        lvl_text = OxmlElement("w:lvlText")
-        lvl_text.set(qn("w:val"), texts[i])
-        lvl.append(lvl_text)
-
-        lvl_jc = OxmlElement("w:lvlJc")
-        lvl_jc.set(qn("w:val"), "left")
-        lvl.append(lvl_jc)
-
-        ppr = OxmlElement("w:pPr")
-        ind = OxmlElement("w:ind")
-        left = str(720 * (i + 1))
-        ind.set(qn("w:left"), left)
-        ind.set(qn("w:hanging"), "360")
-        ppr.append(ind)
-        lvl.append(ppr)
-
-        abstract_num.append(lvl)
-
-    numbering_elem.insert(0, abstract_num)
-
-    num = OxmlElement("w:num")
-    num.set(qn("w:numId"), abstract_num_id)
-    abstract_ref = OxmlElement("w:abstractNumId")
-    abstract_ref.set(qn("w:val"), abstract_num_id)
-    num.append(abstract_ref)
-    numbering_elem.append(num)
-
-
-def _create_lower_letter_numbering(numbering_elem) -> None:
-    """Create an abstract numbering definition for lower-letter lists (a, b, c)."""
-    formats = ["lowerLetter", "lowerRoman", "decimal"]
-    texts = ["%1.", "%2.", "%3."]
-    abstract_num_id = "102"
-
-    abstract_num = OxmlElement("w:abstractNum")
-    abstract_num.set(qn("w:abstractNumId"), abstract_num_id)
-
-    for i in range(3):
-        lvl = OxmlElement("w:lvl")
-        lvl.set(qn("w:ilvl"), str(i))
 
-        start = OxmlElement("w:start")
-        start.set(qn("w:val"), "1")
-        lvl.append(start)
-
-        num_fmt = OxmlElement("w:numFmt")
-        num_fmt.set(qn("w:val"), formats[i])
-        lvl.append(num_fmt)
-
-        lvl_text = OxmlElement("w:lvlText")
-        lvl_text.set(qn("w:val"), texts[i])
-        lvl.append(lvl_text)
-
-        lvl_jc = OxmlElement("w:lvlJc")
-        lvl_jc.set(qn("w:val"), "left")
-        lvl.append(lvl_jc)
-
-        ppr = OxmlElement("w:pPr")
-        ind = OxmlElement("w:ind")
-        left = str(720 * (i + 1))
-        ind.set(qn("w:left"), left)
-        ind.set(qn("w:hanging"), "360")
-        ppr.append(ind)
-        lvl.append(ppr)
-
-        abstract_num.append(lvl)
-
-    numbering_elem.insert(0, abstract_num)
-
-    num = OxmlElement("w:num")
-    num.set(qn("w:numId"), abstract_num_id)
-    abstract_ref = OxmlElement("w:abstractNumId")
-    abstract_ref.set(qn("w:val"), abstract_num_id)
-    num.append(abstract_ref)
-    numbering_elem.append(num)
-
-
-def _create_upper_letter_numbering(numbering_elem) -> None:
-    """Create an abstract numbering definition for upper-letter lists (A, B, C)."""
-    formats = ["upperLetter", "upperRoman", "decimal"]
-    texts = ["%1.", "%2.", "%3."]
-    abstract_num_id = "103"
-
-    abstract_num = OxmlElement("w:abstractNum")
-    abstract_num.set(qn("w:abstractNumId"), abstract_num_id)
-
-    for i in range(3):
-        lvl = OxmlElement("w:lvl")
-        lvl.set(qn("w:ilvl"), str(i))
-
-        start = OxmlElement("w:start")
-        start.set(qn("w:val"), "1")
-        lvl.append(start)
-
-        num_fmt = OxmlElement("w:numFmt")
-        num_fmt.set(qn("w:val"), formats[i])
-        lvl.append(num_fmt)
-
-        lvl_text = OxmlElement("w:lvlText")
-        lvl_text.set(qn("w:val"), texts[i])
-        lvl.append(lvl_text)
-
-        lvl_jc = OxmlElement("w:lvlJc")
-        lvl_jc.set(qn("w:val"), "left")
-        lvl.append(lvl_jc)
-
-        ppr = OxmlElement("w:pPr")
-        ind = OxmlElement("w:ind")
-        left = str(720 * (i + 1))
-        ind.set(qn("w:left"), left)
-        ind.set(qn("w:hanging"), "360")
-        ppr.append(ind)
-        lvl.append(ppr)
-
-        abstract_num.append(lvl)
-
-    numbering_elem.insert(0, abstract_num)
-
-    num = OxmlElement("w:num")
-    num.set(qn("w:numId"), abstract_num_id)
-    abstract_ref = OxmlElement("w:abstractNumId")
-    abstract_ref.set(qn("w:val"), abstract_num_id)
-    num.append(abstract_ref)
-    numbering_elem.append(num)
+# Parsed <w:numPr> subtrees keyed by (ordered, level, marker_format).
+# Only a handful of combinations exist, so each is parsed once and
+# deepcopied per paragraph.
+_NUMPR_CACHE: dict = {}
 
 
 def apply_list_numbering(
@@ -261,25 +136,28 @@ def apply_list_numbering(
         ordered: True for numbered list, False for bullet.
         level: 1-based nesting level (converted to 0-based ilvl).
     """
-    if not ordered:
-        num_id = "100"
-    elif marker_format == "lowerLetter":
-        num_id = "102"
-    elif marker_format == "upperLetter":
-        num_id = "103"
-    else:
-        num_id = "101"
-    ilvl = max(level - 1, 0)
+    key = (ordered, level, marker_format)
+    template = _NUMPR_CACHE.get(key)
+    if template is None:
+        if not ordered:
+            num_id = "100"
+        elif marker_format == "lowerLetter":
+            num_id = "102"
+        elif marker_format == "upperLetter":
+            num_id = "103"
+        else:
+            num_id = "101"
+        ilvl = max(level - 1, 0)
+
+        template = parse_xml(
+            f'<w:numPr xmlns:w="{nsmap["w"]}">'
+            f'<w:ilvl w:val="{ilvl}"/><w:numId w:val="{num_id}"/>'
+            "</w:numPr>"
+        )
+        _NUMPR_CACHE[key] = template
 
     pPr = paragraph._element.get_or_add_pPr()
-    numPr = OxmlElement("w:numPr")
-    ilvl_elem = OxmlElement("w:ilvl")
-    ilvl_elem.set(qn("w:val"), str(ilvl))
-    numPr.append(ilvl_elem)
-    numId_elem = OxmlElement("w:numId")
-    numId_elem.set(qn("w:val"), num_id)
-    numPr.append(numId_elem)
-    pPr.append(numPr)
+    pPr.append(deepcopy(template))
 
 
 def apply_highlight(run, color_name: str) -> None:
@@ -291,7 +169,7 @@ def apply_highlight(run, color_name: str) -> None:
     """
     rPr = run._element.get_or_add_rPr()
     highlight = OxmlElement("w:highlight")
-    highlight.set(qn("w:val"), color_name)
+    highlight.set(_QN_VAL, color_name)
     rPr.append(highlight)
 
 
@@ -308,9 +186,14 @@ def apply_caption_formatting(paragraph, config: StyleConfig) -> None:
 def doc_style_or_fallback(
     doc: Document, style_name: str, fallback: str = "Normal"
 ) -> str:
-    """Return style_name if it exists in doc, otherwise fallback."""
-    try:
-        doc.styles[style_name]
-        return style_name
-    except KeyError:
-        return fallback
+    """Return style_name if it exists in doc, otherwise fallback.
+
+    The style-name set is cached on the document the first time it is
+    queried — python-docx's ``styles[name]`` walks the styles XML on every
+    lookup, which adds up when this is called once per caption.
+    """
+    cache = getattr(doc, "_pdfconv_style_names", None)
+    if cache is None:
+        cache = {s.name for s in doc.styles}
+        doc._pdfconv_style_names = cache
+    return style_name if style_name in cache else fallback
@@ -6,7 +6,10 @@ with properly merged cells (row_span/col_span).
 
 from __future__ import annotations
 
+import logging
+
 from docx.document import Document
+from docx.exceptions import InvalidSpanError
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.table import Table
@@ -15,6 +18,12 @@ from pdf_converter.config import Config
 from pdf_converter.generators.styles import apply_highlight
 from pdf_converter.ir.schema import TableBlock, TextRun
 
+logger = logging.getLogger(__name__)
+
+# Clark-notation names resolved once at import instead of per qn() call
+_QN_TYPE = qn("w:type")
+_QN_W = qn("w:w")
+
 
 def build_table(doc: Document, block: TableBlock, config: Config) -> Table:
     """Create a python-docx Table from a TableBlock.
@@ -27,8 +36,12 @@ def build_table(doc: Document, block: TableBlock, config: Config) -> Table:
     Returns:
         The created Table object.
     """
-    num_rows = block.num_rows or _infer_rows(block)
-    num_cols = block.num_cols or _infer_cols(block)
+    num_rows = block.num_rows
+    num_cols = block.num_cols
+    if not num_rows or not num_cols:
+        inferred_rows, inferred_cols = _infer_dims(block)
+        num_rows = num_rows or inferred_rows
+        num_cols = num_cols or inferred_cols
 
     if num_rows == 0 or num_cols == 0:
         # Empty table — add a minimal 1x1 placeholder
@@ -36,32 +49,58 @@ def build_table(doc: Document, block: TableBlock, config: Config) -> Table:
 
     table = doc.add_table(rows=num_rows, cols=num_cols, style=config.style.table_style)
 
-    # Build a lookup from (row, col) → cell data
-    cell_map = {(c.row, c.col): c for c in block.cells}
-
-    # Track which cells have been merged (to avoid overwriting)
-    merged = set()
+    # Table.cell(r, c) rebuilds the full cell list on every call, which is
+    # quadratic over a big table. Snapshot it once and index directly —
+    # but only until the first merge: merging detaches the spanned w:tc
+    # elements, so snapshot entries at those positions wrap dead XML.
+    # After a merge, lookups fall back to table.cell(), which re-resolves
+    # the grid per call.
+    cells = table._cells
+    grid_cols = table._column_count
+    snapshot_valid = True
+
+    # Track which cells have been merged (to avoid overwriting).
+    # Flat bitmap indexed as r*num_cols + c — one byte per cell beats
+    # tuple hashing in the merge loop below.
+    merged = bytearray(num_rows * num_cols)
 
     for cell_data in block.cells:
         r, c = cell_data.row, cell_data.col
-        if (r, c) in merged:
-            continue
         if r >= num_rows or c >= num_cols:
             continue
-
+        if merged[r * num_cols + c]:
+            continue
         # Merge cells if spanning
         end_row = min(r + cell_data.row_span - 1, num_rows - 1)
         end_col = min(c + cell_data.col_span - 1, num_cols - 1)
 
-        cell = table.cell(r, c)
+        if snapshot_valid:
+            cell = cells[r * grid_cols + c]
+        else:
+            cell = table.cell(r, c)
 
         if end_row > r or end_col > c:
-            cell = cell.merge(table.cell(end_row, end_col))
-            # Mark all spanned positions as merged
-            for mr in range(r, end_row + 1):
-                for mc in range(c, end_col + 1):
-                    if (mr, mc) != (r, c):
-                        merged.add((mr, mc))
+            if snapshot_valid:
+                target = cells[end_row * grid_cols + end_col]
+            else:
+                target = table.cell(end_row, end_col)
+            snapshot_valid = False
+            try:
+                cell = cell.merge(target)
+            except (InvalidSpanError, ValueError, IndexError):
+                # Overlapping spans (Docling does emit them) — keep the
+                # origin cell unmerged so the table degrades instead of
+                # aborting the whole generation.
+                logger.warning(
+                    "Skipping invalid cell span (%d, %d) -> (%d, %d)",
+                    r, c, end_row, end_col,
+                )
+            else:
+                # Mark all spanned positions as merged
+                for mr in range(r, end_row + 1):
+                    row_base = mr * num_cols
+                    for mc in range(c, end_col + 1):
+                        merged[row_base + mc] = 1
 
         # Set cell text
         if cell_data.runs:
@@ -111,8 +150,8 @@ def _set_table_autofit(table: Table) -> None:
         tbl.insert(0, tblPr)
 
     tblW = OxmlElement("w:tblW")
-    tblW.set(qn("w:type"), "pct")
-    tblW.set(qn("w:w"), "5000")  # 5000 = 100% in fifths of a percent
+    tblW.set(_QN_TYPE, "pct")
+    tblW.set(_QN_W, "5000")  # 5000 = 100% in fifths of a percent
     tblPr.append(tblW)
 
 
@@ -126,15 +165,14 @@ def _set_header_row(table: Table) -> None:
     trPr.append(tblHeader)
 
 
-def _infer_rows(block: TableBlock) -> int:
-    """Infer row count from cell data."""
-    if not block.cells:
-        return 0
-    return max(c.row + c.row_span for c in block.cells)
-
-
-def _infer_cols(block: TableBlock) -> int:
-    """Infer column count from cell data."""
-    if not block.cells:
-        return 0
-    return max(c.col + c.col_span for c in block.cells)
+def _infer_dims(block: TableBlock) -> tuple[int, int]:
+    """Infer (row count, column count) from cell data in a single pass."""
+    rows = cols = 0
+    for c in block.cells:
+        row_end = c.row + c.row_span
+        col_end = c.col + c.col_span
+        if row_end > rows:
+            rows = row_end
+        if col_end > cols:
+            cols = col_end
+    return rows, cols
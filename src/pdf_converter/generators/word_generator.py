@@ -7,12 +7,17 @@ recursively beneath them.
 
 from __future__ import annotations
 
+import io
 import logging
+from collections import deque
+from copy import deepcopy
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
 from docx import Document
-from docx.shared import Pt
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsmap
 
 from pdf_converter.config import Config
 from pdf_converter.exceptions import GenerationError
@@ -41,6 +46,26 @@ from pdf_converter.ir.schema import (
 
 logger = logging.getLogger(__name__)
 
+# A page-break run parsed once; each break paragraph gets a deepcopy,
+# skipping the add_run + add_break element construction per break.
+_PAGE_BREAK_RUN = parse_xml(
+    f'<w:r xmlns:w="{nsmap["w"]}"><w:br w:type="page"/></w:r>'
+)
+
+
+@lru_cache(maxsize=128)
+def _confidence_marker_run(label: str):
+    """Parsed marker run (italic, 8pt) for one confidence label.
+
+    Headings cluster on a handful of confidence values, so each distinct
+    label's run subtree is built once and deepcopied per marked heading.
+    """
+    return parse_xml(
+        f'<w:r xmlns:w="{nsmap["w"]}">'
+        '<w:rPr><w:i/><w:sz w:val="16"/><w:szCs w:val="16"/></w:rPr>'
+        f'<w:t xml:space="preserve">{label}</w:t></w:r>'
+    )
+
 
 class WordGenerator:
     """Generates a Word document from a DocumentIR tree."""
@@ -48,6 +73,48 @@ class WordGenerator:
     def __init__(self, config: Optional[Config] = None):
         self.config = config or Config.default()
 
+        # Hot-loop accessors resolved once: every block render otherwise
+        # re-walks config.style.* attribute chains and re-formats style names.
+        style_cfg = self.config.style
+        self._body_style = style_cfg.body_style
+        self._mark_low_confidence = style_cfg.mark_low_confidence
+        self._low_confidence_threshold = style_cfg.low_confidence_threshold
+        self._low_confidence_highlight = style_cfg.low_confidence_highlight
+        self._heading_styles = tuple(
+            heading_style_name(style_cfg, level) for level in range(1, 10)
+        )
+        self._list_styles = {
+            (ordered, level): list_style_name(style_cfg, ordered, level)
+            for ordered in (False, True)
+            for level in (1, 2, 3)
+        }
+        # type → handler map: O(1) dispatch per block instead of walking
+        # an isinstance chain. All handlers share the (doc, block, base_dir)
+        # shape so the dispatcher needs no per-type call logic.
+        self._dispatch = {
+            HeadingBlock: self._render_heading,
+            ParagraphBlock: self._render_paragraph,
+            ListBlock: self._render_list,
+            TableBlock: self._render_table,
+            FigureBlock: self._render_figure,
+            PageBreakBlock: self._render_page_break,
+        }
+        # Trailing sentinel paragraph; set up per generate_document call
+        self._tail = None
+
+    @cached_property
+    def _template_bytes(self) -> bytes:
+        """Default document with this config's styles baked in, as bytes.
+
+        Built once per generator; generate_document clones it by
+        re-opening from memory instead of re-running style setup.
+        """
+        doc = Document()
+        ensure_styles_exist(doc, self.config.style)
+        buf = io.BytesIO()
+        doc.save(buf)
+        return buf.getvalue()
+
     def generate(
         self,
         ir: DocumentIR,
@@ -68,18 +135,12 @@ class WordGenerator:
         if base_dir is None:
             base_dir = output_path.parent
 
-        doc = Document()
-        ensure_styles_exist(doc, self.config.style)
-
-        # Set document title from metadata
-        if ir.metadata.title:
-            doc.core_properties.title = ir.metadata.title
-
-        for block in ir.body:
-            self._render_block(doc, block, base_dir)
+        doc = self.generate_document(ir, base_dir)
 
         try:
-            doc.save(str(output_path))
+            # 1 MiB buffer absorbs the zip layer's many small writes
+            with open(output_path, "wb", buffering=1 << 20) as fh:
+                doc.save(fh)
         except OSError as exc:
             raise GenerationError(f"Failed to save document: {exc}") from exc
 
@@ -100,79 +161,107 @@ class WordGenerator:
         Returns:
             The python-docx Document object.
         """
-        doc = Document()
-        ensure_styles_exist(doc, self.config.style)
+        # Re-opening the pre-styled template from memory skips the
+        # default-template disk read and the numbering-definition build
+        # that a cold Document() + ensure_styles_exist would repeat per
+        # document.
+        doc = Document(io.BytesIO(self._template_bytes))
 
         # Set document title from metadata
         if ir.metadata.title:
             doc.core_properties.title = ir.metadata.title
 
+        # Paragraphs are created via insert_paragraph_before on a trailing
+        # sentinel: Document.add_paragraph re-walks the whole body per call
+        # (quadratic on long documents), while inserting before a known
+        # element is O(1).
+        self._tail = doc.add_paragraph()
+
         for block in ir.body:
             self._render_block(doc, block, base_dir)
 
+        tail_elem = self._tail._element
+        tail_elem.getparent().remove(tail_elem)
+        self._tail = None
+
         return doc
 
+    def _new_paragraph(self, text=None, style=None):
+        """Create a paragraph at the current document end in O(1)."""
+        return self._tail.insert_paragraph_before(text, style)
+
+    def _reset_tail(self, doc: Document) -> None:
+        """Move the sentinel back to the body end.
+
+        Needed after content that appends directly to the body (tables,
+        pictures) and would otherwise land after the sentinel.
+        """
+        tail_elem = self._tail._element
+        tail_elem.getparent().remove(tail_elem)
+        self._tail = doc.add_paragraph()
+
     def _render_block(
         self, doc: Document, block: IRBlock, base_dir: Optional[Path]
     ) -> None:
-        """Dispatch rendering to the appropriate method by block type."""
-        if isinstance(block, HeadingBlock):
-            self._render_heading(doc, block, base_dir)
-        elif isinstance(block, ParagraphBlock):
-            self._render_paragraph(doc, block)
-        elif isinstance(block, ListBlock):
-            self._render_list(doc, block)
-        elif isinstance(block, TableBlock):
-            self._render_table(doc, block)
-        elif isinstance(block, FigureBlock):
-            self._render_figure(doc, block, base_dir)
-        elif isinstance(block, PageBreakBlock):
-            self._render_page_break(doc)
-        else:
-            logger.warning("Unknown block type: %s", type(block).__name__)
+        """Render a block and its heading descendants iteratively.
+
+        A deque work queue replaces Python recursion: deeply nested heading
+        trees stay within bounded stack space and skip per-node frame setup.
+        """
+        queue = deque((block,))
+        while queue:
+            blk = queue.popleft()
+            handler = self._dispatch.get(type(blk))
+            if handler is None:
+                logger.warning("Unknown block type: %s", type(blk).__name__)
+                continue
+            handler(doc, blk, base_dir)
+            if type(blk) is HeadingBlock:
+                # Children come next, before any pending siblings (DFS order)
+                queue.extendleft(reversed(blk.children))
 
     def _render_heading(
         self, doc: Document, block: HeadingBlock, base_dir: Optional[Path]
     ) -> None:
-        """Render a heading and recursively render its children.
+        """Render a heading paragraph (children are handled by the caller).
 
-        Always uses doc.add_paragraph(style=...) to respect heading_prefix
-        configuration, never doc.add_heading() which ignores it.
+        Always creates a plain paragraph with style=... to respect
+        heading_prefix configuration, never doc.add_heading() which ignores it.
         """
-        style_name = heading_style_name(self.config.style, block.level)
-        paragraph = doc.add_paragraph(style=style_name)
-
+        style = self._heading_styles[block.level - 1]
         if block.runs:
+            paragraph = self._new_paragraph(style=style)
             _write_runs(paragraph, block.runs)
         else:
-            paragraph.add_run(block.text)
+            # Common case: plain text, no per-run formatting — let
+            # insert_paragraph_before create the single run directly
+            paragraph = self._new_paragraph(block.text, style=style)
 
         # Mark low-confidence headings if enabled
         if (
-            self.config.style.mark_low_confidence
-            and block.confidence < self.config.style.low_confidence_threshold
+            self._mark_low_confidence
+            and block.confidence < self._low_confidence_threshold
         ):
             for run in paragraph.runs:
-                apply_highlight(run, self.config.style.low_confidence_highlight)
-            marker = paragraph.add_run(
-                f"  [{block.confidence:.0%}]"
-            )
-            marker.font.size = Pt(8)
-            marker.font.italic = True
-
-        # Recursively render children
-        for child in block.children:
-            self._render_block(doc, child, base_dir)
-
-    def _render_paragraph(self, doc: Document, block: ParagraphBlock) -> None:
+                apply_highlight(run, self._low_confidence_highlight)
+            marker = _confidence_marker_run(f"  [{block.confidence:.0%}]")
+            paragraph._p.append(deepcopy(marker))
+
+        # Children are rendered by the _render_block work queue
+
+    def _render_paragraph(
+        self, doc: Document, block: ParagraphBlock, base_dir: Optional[Path]
+    ) -> None:
         """Render a paragraph with optional formatted runs."""
         if block.runs:
-            paragraph = doc.add_paragraph(style=self.config.style.body_style)
+            paragraph = self._new_paragraph(style=self._body_style)
             _write_runs(paragraph, block.runs)
         else:
-            doc.add_paragraph(block.text, style=self.config.style.body_style)
+            self._new_paragraph(block.text, style=self._body_style)
 
-    def _render_list(self, doc: Document, block: ListBlock) -> None:
+    def _render_list(
+        self, doc: Document, block: ListBlock, base_dir: Optional[Path]
+    ) -> None:
         """Render a list block with nested items."""
         ordered = block.style == "ordered"
         marker_format = block.marker_format
@@ -184,13 +273,13 @@ class WordGenerator:
         marker_format: str | None = None,
     ) -> None:
         """Render a single list item, then recurse into children."""
-        style = list_style_name(self.config.style, ordered, level)
+        style = self._list_styles[(ordered, level)]
 
         if item.runs:
-            paragraph = doc.add_paragraph(style=style)
+            paragraph = self._new_paragraph(style=style)
             _write_runs(paragraph, item.runs)
         else:
-            paragraph = doc.add_paragraph(item.text, style=style)
+            paragraph = self._new_paragraph(item.text, style=style)
 
         # Apply numbering XML so bullets/numbers actually render
         apply_list_numbering(paragraph, doc, ordered, level, marker_format=marker_format)
@@ -198,33 +287,64 @@ class WordGenerator:
         for child in item.children:
             self._render_list_item(doc, child, ordered, level=min(level + 1, 3), marker_format=marker_format)
 
-    def _render_table(self, doc: Document, block: TableBlock) -> None:
+    def _render_table(
+        self, doc: Document, block: TableBlock, base_dir: Optional[Path]
+    ) -> None:
         """Render a table using the table builder."""
         build_table(doc, block, self.config)
+        self._reset_tail(doc)
 
     def _render_figure(
         self, doc: Document, block: FigureBlock, base_dir: Optional[Path]
     ) -> None:
         """Render a figure (image + optional caption)."""
         add_image(doc, block, self.config.image, base_dir)
+        self._reset_tail(doc)
 
         if block.caption:
-            p = doc.add_paragraph(block.caption)
+            p = self._new_paragraph(block.caption)
             apply_caption_formatting(p, self.config.style)
 
-    def _render_page_break(self, doc: Document) -> None:
+    def _render_page_break(
+        self, doc: Document, block: PageBreakBlock, base_dir: Optional[Path]
+    ) -> None:
         """Render a page break."""
-        from docx.enum.text import WD_BREAK
+        paragraph = self._new_paragraph()
+        paragraph._p.append(deepcopy(_PAGE_BREAK_RUN))
+
 
-        paragraph = doc.add_paragraph()
-        run = paragraph.add_run()
-        run.add_break(WD_BREAK.PAGE)
+def _fmt_key(run_data: TextRun) -> tuple:
+    """Formatting signature used to coalesce adjacent runs."""
+    return (
+        run_data.bold,
+        run_data.italic,
+        run_data.underline,
+        run_data.strikethrough,
+        run_data.superscript,
+        run_data.subscript,
+        run_data.highlight,
+    )
 
 
 def _write_runs(paragraph, runs: list[TextRun]) -> None:
-    """Write formatted TextRuns into a paragraph."""
-    for run_data in runs:
-        run = paragraph.add_run(run_data.text)
+    """Write formatted TextRuns into a paragraph.
+
+    Consecutive runs with identical formatting are coalesced into one Word
+    run — PDF extraction produces many fine-grained runs, and each add_run
+    plus attribute assignment touches the XML tree.
+    """
+    idx = 0
+    count = len(runs)
+    while idx < count:
+        run_data = runs[idx]
+        key = _fmt_key(run_data)
+        texts = [run_data.text]
+        idx += 1
+        while idx < count and _fmt_key(runs[idx]) == key:
+            texts.append(runs[idx].text)
+            idx += 1
+
+        run = paragraph.add_run("".join(texts))
         run.bold = run_data.bold
         run.italic = run_data.italic
         run.underline = run_data.underline
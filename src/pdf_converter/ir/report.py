@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import json
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from typing import Optional
 
+try:  # optional accelerator — install with pdf-converter[speed]
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+from pdf_converter.ir.schema import (
+    FigureBlock,
+    HeadingBlock,
+    ListBlock,
+    ParagraphBlock,
+    TableBlock,
+)
+
+
+@dataclass(slots=True)
 class LowConfidenceItem:
     """A heading flagged as low-confidence during classification."""
 
@@ -19,7 +33,7 @@ class LowConfidenceItem:
     reason: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionReport:
     """Summary of a PDF-to-Word conversion run."""
 
@@ -51,6 +65,8 @@ class ConversionReport:
 
     def to_json(self, indent: int = 2) -> str:
         """Serialize to JSON string."""
+        if orjson is not None and indent == 2:
+            return orjson.dumps(self._to_dict(), option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self._to_dict(), indent=indent)
 
     def _to_dict(self) -> dict:
@@ -102,38 +118,43 @@ class ConversionReport:
 
 
 def _walk_blocks(blocks: list, report: ConversionReport) -> None:
-    """Recursively walk IR blocks to populate report counters."""
-    from pdf_converter.ir.schema import (
-        FigureBlock,
-        HeadingBlock,
-        ListBlock,
-        ParagraphBlock,
-        TableBlock,
-    )
-
-    for block in blocks:
-        if isinstance(block, HeadingBlock):
+    """Walk IR blocks depth-first to populate report counters.
+
+    Iterative (deque-based) so deeply nested heading trees neither hit the
+    recursion limit nor pay a Python call frame per node. Non-heading
+    blocks are tallied into a Counter keyed by type — one C-level
+    dict-store per node — and copied onto the report at the end; headings
+    need per-level and confidence bookkeeping, so they stay inline.
+    """
+    type_counts: Counter = Counter()
+    stack = deque(blocks)
+    while stack:
+        block = stack.popleft()
+        block_type = type(block)
+        if block_type is HeadingBlock:
             report.heading_count += 1
             report.headings_by_level[block.level] = (
                 report.headings_by_level.get(block.level, 0) + 1
             )
             if block.confidence < report.low_confidence_threshold:
+                # Truncate/round here so serialization doesn't redo it per
+                # item (and long heading texts aren't kept alive in memory)
                 report.low_confidence_items.append(
                     LowConfidenceItem(
                         block_id=block.id,
-                        text=block.text,
+                        text=block.text[:80],
                         level=block.level,
                         page=block.page,
-                        confidence=block.confidence,
+                        confidence=round(block.confidence, 2),
                         reason=block.classification_reason,
                     )
                 )
-            _walk_blocks(block.children, report)
-        elif isinstance(block, ParagraphBlock):
-            report.paragraph_count += 1
-        elif isinstance(block, TableBlock):
-            report.table_count += 1
-        elif isinstance(block, FigureBlock):
-            report.figure_count += 1
-        elif isinstance(block, ListBlock):
-            report.list_count += 1
+            # Children come next, before any pending siblings (DFS order)
+            stack.extendleft(reversed(block.children))
+        else:
+            type_counts[block_type] += 1
+
+    report.paragraph_count = type_counts[ParagraphBlock]
+    report.table_count = type_counts[TableBlock]
+    report.figure_count = type_counts[FigureBlock]
+    report.list_count = type_counts[ListBlock]
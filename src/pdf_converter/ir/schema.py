@@ -3,19 +3,31 @@
 The IR is a tree-structured JSON format where headings contain their children,
 mirroring Polarion ALM's work item hierarchy. This is the central contract
 between the parser and generator stages.
+
+These stay Pydantic BaseModels deliberately: the discriminated-union JSON
+round-trip and the field constraints (heading level 1-9, confidence 0-1)
+are part of the contract, and v2's Rust-core construction is faster than
+the pure-Python alternatives (model_construct included) for these shapes.
+
+The block classes are final — do not subclass them. Hot parser loops
+dispatch with exact ``type(el) is ...`` checks, which a subclass would
+silently fall through.
 """
 
 from __future__ import annotations
 
-import uuid
+import os
 from enum import Enum
+from pathlib import Path
 from typing import Annotated, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
 
 def _make_id() -> str:
-    return uuid.uuid4().hex[:12]
+    # 48 random bits as 12 hex chars — same entropy as the previous
+    # uuid4().hex[:12] without building a full UUID object per block.
+    return os.urandom(6).hex()
 
 
 # ---------------------------------------------------------------------------
@@ -197,7 +209,22 @@ class DocumentIR(BaseModel):
         """Serialize to JSON string."""
         return self.model_dump_json(indent=2, **kwargs)
 
+    def dump_json_to(self, path: Path) -> None:
+        """Serialize compactly to a file as UTF-8 bytes.
+
+        Writes unindented JSON in one binary write — no indentation
+        whitespace and no text-layer newline translation, which matters
+        for multi-megabyte checkpoint files.
+        """
+        with open(path, "wb") as f:
+            f.write(self.model_dump_json().encode("utf-8"))
+
     @classmethod
-    def from_json(cls, json_str: str) -> DocumentIR:
-        """Deserialize from JSON string."""
-        return cls.model_validate_json(json_str)
+    def from_json(cls, json_data: str | bytes) -> DocumentIR:
+        """Deserialize from a JSON string or UTF-8 bytes.
+
+        Passing bytes (e.g. Path.read_bytes) is preferred for files —
+        the Rust-core parser consumes them directly, skipping a separate
+        Python-level UTF-8 decode of the whole document.
+        """
+        return cls.model_validate_json(json_data)
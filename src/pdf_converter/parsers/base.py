@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import mmap
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 
@@ -42,9 +45,46 @@ class BasePdfParser(ABC):
 
     @staticmethod
     def file_hash(path: Path) -> str:
-        """Compute SHA-256 hash of a file for IR metadata."""
-        h = hashlib.sha256()
+        """Compute SHA-256 hash of a file for IR metadata.
+
+        Results are memoized on (path, size, mtime) so re-parsing or
+        batch-processing the same unchanged file hashes it once; any
+        modification changes the stat signature and misses the cache.
+
+        The hash is a change-detection fingerprint, not a security boundary,
+        so the hasher is created with usedforsecurity=False — this skips FIPS
+        wrapper overhead and goes straight to OpenSSL's hardware-accelerated
+        (SHA-NI/ARMv8) implementation where available.
+        """
+        st = os.stat(path)
+        return BasePdfParser._file_hash_cached(
+            str(path), st.st_size, st.st_mtime_ns
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _file_hash_cached(path: str, size: int, mtime_ns: int) -> str:
+        _sha256 = lambda: hashlib.new("sha256", usedforsecurity=False)  # noqa: E731
         with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
-        return h.hexdigest()
+            if os.fstat(f.fileno()).st_size >= 1 << 20:
+                # Large file: hash straight from the page cache — update()
+                # accepts the mmap buffer, so the whole file goes through
+                # one C call with no read-buffer copies.
+                try:
+                    with mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as mm:
+                        h = _sha256()
+                        h.update(mm)
+                        return h.hexdigest()
+                except (OSError, ValueError):
+                    pass  # mmap not supported here — use the read path
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, _sha256).hexdigest()
+            # Fallback: 1 MiB readinto loop — no per-chunk bytes allocation
+            h = _sha256()
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            while n := f.readinto(view):
+                h.update(view[:n])
+            return h.hexdigest()
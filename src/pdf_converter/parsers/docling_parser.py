@@ -7,9 +7,13 @@ flat document elements into a tree where headings contain their children.
 
 from __future__ import annotations
 
+import itertools
 import logging
 import re
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -35,12 +39,48 @@ from pdf_converter.parsers.base import BasePdfParser
 
 logger = logging.getLogger(__name__)
 
+# Docling entry points, imported on first parse and cached so batch runs
+# don't repeat the sys.modules lookups and attribute binds per document.
+_docling_classes: Optional[tuple] = None
+
+
+def _ensure_docling_imported() -> tuple:
+    """Import and cache Docling's converter classes.
+
+    Returns:
+        Tuple of (DocumentConverter, PdfFormatOption, PdfPipelineOptions,
+        InputFormat).
+
+    Raises:
+        ParseError: If Docling is not installed.
+    """
+    global _docling_classes
+    if _docling_classes is None:
+        try:
+            from docling.datamodel.base_models import InputFormat
+            from docling.datamodel.pipeline_options import PdfPipelineOptions
+            from docling.document_converter import (
+                DocumentConverter,
+                PdfFormatOption,
+            )
+        except ImportError:
+            raise ParseError(
+                "Docling is not installed. Install with: pip install 'docling>=2.70'"
+            )
+        _docling_classes = (
+            DocumentConverter,
+            PdfFormatOption,
+            PdfPipelineOptions,
+            InputFormat,
+        )
+    return _docling_classes
+
 
 # ---------------------------------------------------------------------------
 # Internal data structure for accumulating list items before grouping
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class _PendingListItem:
     """Temporary holder for a Docling list item before grouping."""
     text: str
@@ -56,21 +96,31 @@ class DoclingParser(BasePdfParser):
 
     def __init__(self, config: Config | None = None):
         super().__init__(config)
-        self._docling_version: str | None = None
+        # Lazy thread pool for figure saves — PNG encoding releases the
+        # GIL inside PIL, so saves overlap the document walk instead of
+        # serializing with it. Futures are drained at the end of _build_ir.
+        self._io_pool: ThreadPoolExecutor | None = None
+        self._pending_saves: list[tuple[Path, Future]] = []
+        # Disambiguates figures lacking a self_ref — monotonic, so no
+        # urandom syscall per figure and filenames are deterministic
+        self._fig_counter = itertools.count()
+
+    def __del__(self):
+        pool = getattr(self, "_io_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=True)
 
     @property
     def name(self) -> str:
         return "docling"
 
-    @property
+    @cached_property
     def version(self) -> str:
-        if self._docling_version is None:
-            try:
-                import importlib.metadata
-                self._docling_version = importlib.metadata.version("docling")
-            except Exception:
-                self._docling_version = "unknown"
-        return self._docling_version
+        try:
+            import importlib.metadata
+            return importlib.metadata.version("docling")
+        except Exception:
+            return "unknown"
 
     def parse(self, pdf_path: Path) -> DocumentIR:
         """Parse a PDF using Docling and return its IR.
@@ -88,18 +138,14 @@ class DoclingParser(BasePdfParser):
         if not pdf_path.exists():
             raise ParseError(f"PDF file not found: {pdf_path}")
 
-        try:
-            from docling.document_converter import DocumentConverter
-        except ImportError:
-            raise ParseError(
-                "Docling is not installed. Install with: pip install 'docling>=2.70'"
-            )
+        (
+            DocumentConverter,
+            PdfFormatOption,
+            PdfPipelineOptions,
+            InputFormat,
+        ) = _ensure_docling_imported()
 
         try:
-            from docling.datamodel.pipeline_options import PdfPipelineOptions
-            from docling.datamodel.base_models import InputFormat
-            from docling.document_converter import PdfFormatOption
-
             pipeline_options = PdfPipelineOptions()
             if not self.config.parser.ocr_enabled:
                 pipeline_options.do_ocr = False
@@ -126,17 +172,13 @@ class DoclingParser(BasePdfParser):
         # Extract flat list of elements + furniture in a single pass
         elements, furniture, has_parts = self._extract_elements(doc, pdf_path)
 
-        # Split headings that Docling merged with middle-dot separators
-        elements = _split_compound_headings(elements)
-
-        # Promote misclassified paragraphs with multi-level numbering
-        elements = _promote_numbered_paragraphs(elements)
-
-        # Promote list items with multi-level numbering to headings
-        elements = _promote_numbered_list_items(elements)
+        # Compound-heading splits plus paragraph/list-item numbered
+        # promotions, fused into one traversal
+        elements, heading_indices = _apply_block_transforms(elements)
 
-        # Universal heading level assignment based on text content
-        _resolve_heading_levels(elements, has_parts)
+        # Universal heading level assignment based on text content —
+        # visits only the headings indexed during the rewrite pass
+        _resolve_heading_levels(elements, has_parts, heading_indices)
 
         # Group consecutive pending list items into ListBlocks
         elements = _group_list_items(elements)
@@ -159,6 +201,9 @@ class DoclingParser(BasePdfParser):
             title=title,
         )
 
+        # All figure files must exist before the IR is handed to a generator
+        self._drain_image_saves()
+
         return DocumentIR(metadata=metadata, body=body, furniture=furniture)
 
     def _extract_elements(
@@ -172,7 +217,14 @@ class DoclingParser(BasePdfParser):
             whether PART/CHAPTER structural markers were found.
         """
         elements: list = []
-        furniture_map: dict[tuple[str, str], FurnitureItem] = {}
+        # Furniture dedup: one text-keyed dict per type (no tuple-key
+        # hashing), with page numbers accumulated in sets — a footer
+        # repeating on every page costs O(1) per occurrence instead of an
+        # O(n) list scan.
+        header_map: dict[str, FurnitureItem] = {}
+        footer_map: dict[str, FurnitureItem] = {}
+        header_pages: dict[str, set[int]] = {}
+        footer_pages: dict[str, set[int]] = {}
         has_parts = False
 
         try:
@@ -183,88 +235,117 @@ class DoclingParser(BasePdfParser):
                 "Install with: pip install 'docling-core>=2.0'"
             )
 
+        # --- Label handlers: one dict lookup per item instead of walking
+        # an if/elif ladder of enum comparisons. All handlers share the
+        # (item, page, text, nesting_depth) shape; unknown labels fall
+        # through to the paragraph/skip default below.
+
+        def _add_furniture(furn_map, furn_pages, ftype, page, text):
+            # Collect furniture in a single pass, deduplicating by text
+            stripped = text.strip()
+            if not stripped:
+                return
+            if stripped not in furn_map:
+                furn_map[stripped] = FurnitureItem(type=ftype, text=stripped)
+                furn_pages[stripped] = set()
+            if page:
+                furn_pages[stripped].add(page)
+
+        def _on_header(item, page, text, nesting_depth):
+            _add_furniture(
+                header_map, header_pages, FurnitureType.HEADER, page, text
+            )
+
+        def _on_footer(item, page, text, nesting_depth):
+            _add_furniture(
+                footer_map, footer_pages, FurnitureType.FOOTER, page, text
+            )
+
+        def _on_heading(item, page, text, nesting_depth):
+            nonlocal has_parts
+            # Placeholder level=2; resolved later by _resolve_heading_levels
+            elements.append(
+                HeadingBlock(
+                    level=2,
+                    text=text,
+                    page=page,
+                    runs=self._extract_runs(item),
+                    confidence=0.85,
+                    classification_reason=sys.intern(
+                        f"docling_label:{item.label.value}"
+                    ),
+                )
+            )
+            if _is_structural_marker(text):
+                has_parts = True
+
+        def _on_list_item(item, page, text, nesting_depth):
+            marker = getattr(item, "marker", "")
+            elements.append(
+                _PendingListItem(
+                    text=text,
+                    runs=self._extract_runs(item),
+                    page=page,
+                    enumerated=getattr(item, "enumerated", False),
+                    marker=str(marker) if marker else "",
+                    nesting_depth=nesting_depth,
+                )
+            )
+
+        def _on_table(item, page, text, nesting_depth):
+            table_block = self._convert_table(item, page, doc)
+            if table_block:
+                elements.append(table_block)
+
+        def _on_picture(item, page, text, nesting_depth):
+            elements.append(self._convert_figure(item, doc, pdf_path, page))
+
+        handlers = {
+            DocItemLabel.PAGE_HEADER: _on_header,
+            DocItemLabel.PAGE_FOOTER: _on_footer,
+            DocItemLabel.SECTION_HEADER: _on_heading,
+            DocItemLabel.TITLE: _on_heading,
+            DocItemLabel.LIST_ITEM: _on_list_item,
+            DocItemLabel.TABLE: _on_table,
+            DocItemLabel.PICTURE: _on_picture,
+        }
+        get_handler = handlers.get
+
         for item, nesting_depth in doc.iterate_items():
             label = getattr(item, "label", None)
             page = self._get_page_number(item)
             text = self._get_text(item)
 
-            # --- Furniture: collect in single pass, deduplicate by text ---
-            if label == DocItemLabel.PAGE_HEADER and text.strip():
-                key = (FurnitureType.HEADER, text.strip())
-                if key in furniture_map:
-                    if page and page not in furniture_map[key].pages:
-                        furniture_map[key].pages.append(page)
-                else:
-                    furniture_map[key] = FurnitureItem(
-                        type=FurnitureType.HEADER,
-                        text=text.strip(),
-                        pages=[page] if page else [],
-                    )
-                continue
-            elif label == DocItemLabel.PAGE_FOOTER and text.strip():
-                key = (FurnitureType.FOOTER, text.strip())
-                if key in furniture_map:
-                    if page and page not in furniture_map[key].pages:
-                        furniture_map[key].pages.append(page)
-                else:
-                    furniture_map[key] = FurnitureItem(
-                        type=FurnitureType.FOOTER,
-                        text=text.strip(),
-                        pages=[page] if page else [],
-                    )
-                continue
-
-            # --- Content elements ---
-            if label in (DocItemLabel.SECTION_HEADER, DocItemLabel.TITLE):
-                runs = self._extract_runs(item)
-                # Placeholder level=2; resolved later by _resolve_heading_levels
-                elements.append(
-                    HeadingBlock(
-                        level=2,
-                        text=text,
-                        page=page,
-                        runs=runs,
-                        confidence=0.85,
-                        classification_reason=f"docling_label:{label.value}",
-                    )
-                )
-                if _is_structural_marker(text):
-                    has_parts = True
-            elif label == DocItemLabel.LIST_ITEM:
-                enumerated = getattr(item, "enumerated", False)
-                marker = getattr(item, "marker", "")
-                runs = self._extract_runs(item)
-                elements.append(
-                    _PendingListItem(
-                        text=text,
-                        runs=runs,
-                        page=page,
-                        enumerated=enumerated,
-                        marker=str(marker) if marker else "",
-                        nesting_depth=nesting_depth,
-                    )
-                )
-            elif label == DocItemLabel.TABLE:
-                table_block = self._convert_table(item, page, doc)
-                if table_block:
-                    elements.append(table_block)
-            elif label == DocItemLabel.PICTURE:
-                figure = self._convert_figure(item, doc, pdf_path, page)
-                elements.append(figure)
+            handler = get_handler(label)
+            if handler is not None:
+                handler(item, page, text, nesting_depth)
             elif text.strip():
-                runs = self._extract_runs(item)
                 elements.append(
-                    ParagraphBlock(text=text, page=page, runs=runs)
+                    ParagraphBlock(
+                        text=text, page=page, runs=self._extract_runs(item)
+                    )
                 )
 
-        furniture = list(furniture_map.values())
+        furniture = []
+        for furn_map, furn_pages in (
+            (header_map, header_pages),
+            (footer_map, footer_pages),
+        ):
+            for stripped, entry in furn_map.items():
+                entry.pages = sorted(furn_pages[stripped])
+                furniture.append(entry)
         return elements, furniture, has_parts
 
     def _get_text(self, item) -> str:
         """Extract text content from a Docling item, normalizing whitespace."""
-        if hasattr(item, "text"):
-            return re.sub(r"[ \t]+", " ", item.text).strip()
-        return ""
+        t = getattr(item, "text", None)
+        if not t:
+            return ""
+        # Most item texts are already normalized — three C-level contains
+        # checks decide whether the split/join pass is needed at all
+        if "\t" not in t and "\n" not in t and "  " not in t:
+            return t.strip()
+        return " ".join(t.split())
 
     def _get_page_number(self, item) -> Optional[int]:
         """Extract page number from a Docling item's provenance."""
@@ -293,14 +374,17 @@ class DoclingParser(BasePdfParser):
                     continue
                 fmt = getattr(child, "formatting", None)
                 if fmt:
+                    # Formatting is a fixed-schema Docling model — read its
+                    # fields directly rather than getattr-with-default
+                    script = fmt.script
                     runs.append(TextRun(
                         text=child_text,
-                        bold=getattr(fmt, "bold", False) or False,
-                        italic=getattr(fmt, "italic", False) or False,
-                        underline=getattr(fmt, "underline", False) or False,
-                        strikethrough=getattr(fmt, "strikethrough", False) or False,
-                        superscript=getattr(fmt, "script", None) == "superscript",
-                        subscript=getattr(fmt, "script", None) == "subscript",
+                        bold=fmt.bold or False,
+                        italic=fmt.italic or False,
+                        underline=fmt.underline or False,
+                        strikethrough=fmt.strikethrough or False,
+                        superscript=script == "superscript",
+                        subscript=script == "subscript",
                     ))
                 else:
                     runs.append(TextRun(text=child_text))
@@ -311,14 +395,15 @@ class DoclingParser(BasePdfParser):
             if fmt:
                 text = self._get_text(item)
                 if text:
+                    script = fmt.script
                     runs.append(TextRun(
                         text=text,
-                        bold=getattr(fmt, "bold", False) or False,
-                        italic=getattr(fmt, "italic", False) or False,
-                        underline=getattr(fmt, "underline", False) or False,
-                        strikethrough=getattr(fmt, "strikethrough", False) or False,
-                        superscript=getattr(fmt, "script", None) == "superscript",
-                        subscript=getattr(fmt, "script", None) == "subscript",
+                        bold=fmt.bold or False,
+                        italic=fmt.italic or False,
+                        underline=fmt.underline or False,
+                        strikethrough=fmt.strikethrough or False,
+                        superscript=script == "superscript",
+                        subscript=script == "subscript",
                     ))
 
         return runs
@@ -355,13 +440,22 @@ class DoclingParser(BasePdfParser):
             max_row = 0
             max_col = 0
 
+            # TableCell has a fixed schema — direct attribute access per
+            # field; the surrounding except catches any shape surprise and
+            # falls back to the DataFrame path
             for tc in table_cells:
-                r_start = getattr(tc, "start_row_offset_idx", 0)
-                r_end = getattr(tc, "end_row_offset_idx", r_start + 1)
-                c_start = getattr(tc, "start_col_offset_idx", 0)
-                c_end = getattr(tc, "end_col_offset_idx", c_start + 1)
-                text = getattr(tc, "text", "")
-                text = re.sub(r"[ \t]+", " ", text).strip() if text else ""
+                r_start = tc.start_row_offset_idx
+                r_end = tc.end_row_offset_idx
+                c_start = tc.start_col_offset_idx
+                c_end = tc.end_col_offset_idx
+                text = tc.text
+                if text:
+                    if "\t" not in text and "\n" not in text and "  " not in text:
+                        text = text.strip()
+                    else:
+                        text = " ".join(text.split())
+                else:
+                    text = ""
 
                 row_span = max(r_end - r_start, 1)
                 col_span = max(c_end - c_start, 1)
@@ -401,8 +495,6 @@ class DoclingParser(BasePdfParser):
             num_rows = len(table_data)
             num_cols = len(table_data.columns) if num_rows > 0 else 0
 
-            cells = []
-
             # Check if column names are auto-generated integers (skip fake header)
             cols_are_auto = all(
                 isinstance(c, int) for c in table_data.columns
@@ -410,24 +502,27 @@ class DoclingParser(BasePdfParser):
 
             if not cols_are_auto:
                 # Add header row from column names
-                for col_idx, col_name in enumerate(table_data.columns):
-                    cells.append(
-                        TableCell(row=0, col=col_idx, text=str(col_name))
-                    )
+                cells = [
+                    TableCell(row=0, col=col_idx, text=str(col_name))
+                    for col_idx, col_name in enumerate(table_data.columns)
+                ]
                 row_offset = 1
             else:
+                cells = []
                 row_offset = 0
 
-            # Add data rows
-            for row_idx, (_, row) in enumerate(table_data.iterrows()):
-                for col_idx, value in enumerate(row):
-                    cells.append(
-                        TableCell(
-                            row=row_idx + row_offset,
-                            col=col_idx,
-                            text=str(value),
-                        )
-                    )
+            # Add data rows — to_numpy(dtype=object) hands back the raw
+            # values in one shot (iterrows() would build a Series per
+            # row), and the comprehension appends at C level.
+            cells += [
+                TableCell(
+                    row=row_idx + row_offset,
+                    col=col_idx,
+                    text=str(value),
+                )
+                for row_idx, row in enumerate(table_data.to_numpy(dtype=object))
+                for col_idx, value in enumerate(row)
+            ]
 
             total_rows = num_rows + row_offset
 
@@ -474,11 +569,12 @@ class DoclingParser(BasePdfParser):
                 if item_id:
                     img_name = f"fig_p{page or 0}_{str(item_id).replace('/', '_').replace('#', '')}.png"
                 else:
-                    import uuid
-                    img_name = f"fig_p{page or 0}_{uuid.uuid4().hex[:8]}.png"
+                    img_name = (
+                        f"fig_p{page or 0}_{next(self._fig_counter):06d}.png"
+                    )
 
                 img_path = images_dir / img_name
-                pil_image.save(str(img_path), format="PNG")
+                self._save_image_async(pil_image, img_path)
                 image_path = str(img_path)
 
                 # Compute dimensions in inches
@@ -498,6 +594,34 @@ class DoclingParser(BasePdfParser):
             height_inches=height_inches,
         )
 
+    def _save_image_async(self, pil_image, img_path: Path) -> None:
+        """Queue a figure save on the I/O pool (created on first use)."""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="pdfconv-img"
+            )
+        future = self._io_pool.submit(
+            pil_image.save,
+            str(img_path),
+            format="PNG",
+            compress_level=self.config.parser.image_compress_level,
+            optimize=False,
+        )
+        self._pending_saves.append((img_path, future))
+
+    def _drain_image_saves(self) -> None:
+        """Wait for queued figure saves; log any that failed.
+
+        A failed save leaves a dangling image_path in its FigureBlock —
+        the generator already degrades that to a placeholder.
+        """
+        for img_path, future in self._pending_saves:
+            try:
+                future.result()
+            except Exception as exc:
+                logger.warning("Could not save image %s: %s", img_path, exc)
+        self._pending_saves.clear()
+
     def _get_caption(self, item) -> str:
         """Extract caption text from a figure item."""
         # Docling v2: captions is a list of RefItem
@@ -544,7 +668,7 @@ class DoclingParser(BasePdfParser):
 
         # Fall back to first heading
         for block in body:
-            if isinstance(block, HeadingBlock):
+            if type(block) is HeadingBlock:
                 return block.text
 
         return ""
@@ -554,6 +678,27 @@ class DoclingParser(BasePdfParser):
 # Heading numbering detection
 # ---------------------------------------------------------------------------
 
+# All numbering shapes in one alternation so a call enters the regex
+# engine once; alternatives are tried in order, dispatched via named
+# groups. bare = whole text is a multi-part number ("2.2", "2.2."),
+# num = number followed by text ("1. Intro", "1.2 Scope"),
+# letter = letter-prefixed ("A.1 Section", "B.2.1 Sub").
+_COMBINED_NUM_RE = re.compile(
+    r"^(?:"
+    r"(?P<bare>\d+(?:\.\d+)+)\.?\s*$"
+    r"|(?P<num>\d+(?:\.\d+)*)\.?\s+\S"
+    r"|(?P<letter>[A-Z])\.(?P<letter_num>\d+(?:\.\d+)*)\s"
+    r")"
+)
+
+# Single-number exception patterns (see _level_from_numbering)
+_SINGLE_NUM_DOT_RE = re.compile(r"^\d+\.\s")
+_SINGLE_NUM_DOT_DIGIT_RE = re.compile(r"^\d+\.\d")
+_SINGLE_NUM_ALLCAPS_RE = re.compile(r"^\d+\s+[A-Z]{2}")
+_SINGLE_NUM_CAPWORD_RE = re.compile(r"^\d\s+[A-Z][a-z]{4,}")
+
+
+@lru_cache(maxsize=4096)
 def _level_from_numbering(text: str) -> Optional[int]:
     """Infer heading level from section numbering in text.
 
@@ -568,37 +713,46 @@ def _level_from_numbering(text: str) -> Optional[int]:
     - "1 Week Lookback" (digit followed by non-section word)
     - "100 items" (number without dot and without uppercase section start)
     """
-    # Bare section numbers: entire text is just "2.2" or "2.2." etc.
-    bare = re.match(r"^(\d+(?:\.\d+)+)\.?\s*$", text.strip())
-    if bare:
-        parts = bare.group(1).split(".")
-        return min(len(parts), 9)
-
-    # Numbered sections: 1. or 1.2 or 1.2.3 followed by space+letter or end
-    match = re.match(r"^(\d+(?:\.\d+)*)(\.?\s+\S)", text)
-    if match:
-        parts = match.group(1).split(".")
+    text = text.strip()
+    # Cheap first-byte guard: every numbering shape starts with a digit
+    # or an uppercase letter, and most texts don't — skip the regex
+    # engine entirely for those.
+    if not text:
+        return None
+    first = text[0]
+    if not ("0" <= first <= "9" or "A" <= first <= "Z"):
+        return None
+
+    match = _COMBINED_NUM_RE.match(text)
+    if match is None:
+        return None
+
+    bare = match.group("bare")
+    if bare is not None:
+        return min(bare.count(".") + 1, 9)
+
+    num = match.group("num")
+    if num is not None:
+        parts_count = num.count(".") + 1
         # Single number like "1 Week" — require trailing dot: "1. " or "1.x"
         # Exceptions that ARE headings:
         #   "3 QUALITY CONTROL" — number + ALL-CAPS text
         #   "1 Locomotives Affected" — single digit + capitalized word (5+ chars)
-        if len(parts) == 1:
-            if not re.match(r"^\d+\.\s", text) and not re.match(r"^\d+\.\d", text):
+        if parts_count == 1:
+            if (
+                not _SINGLE_NUM_DOT_RE.match(text)
+                and not _SINGLE_NUM_DOT_DIGIT_RE.match(text)
+            ):
                 # Allow: single digit + space + capitalized word of 5+ chars
                 # e.g. "3 Safety Instructions", "1 Locomotives Affected"
                 # Rejects: "1 Week Lookback", "2 Way valve"
-                if not re.match(r"^\d+\s+[A-Z]{2}", text):
-                    if not re.match(r"^\d\s+[A-Z][a-z]{4,}", text):
+                if not _SINGLE_NUM_ALLCAPS_RE.match(text):
+                    if not _SINGLE_NUM_CAPWORD_RE.match(text):
                         return None
-        return min(len(parts), 9)
+        return min(parts_count, 9)
 
     # Letter-prefixed: A.1, B.2.1
-    match = re.match(r"^[A-Z]\.(\d+(?:\.\d+)*)\s", text)
-    if match:
-        parts = match.group(1).split(".")
-        return min(len(parts) + 1, 9)
-
-    return None
+    return min(match.group("letter_num").count(".") + 2, 9)
 
 
 # ---------------------------------------------------------------------------
@@ -614,14 +768,23 @@ _LEVEL1_STRUCTURAL_RE = re.compile(
 )
 
 
+@lru_cache(maxsize=4096)
 def _is_structural_marker(text: str) -> bool:
     """PART/CHAPTER markers (triggers has_parts offset)."""
-    return bool(_STRUCTURAL_MARKER_RE.match(text.strip()))
+    text = text.strip()
+    # First-byte reject: both keywords start with P or C, most text doesn't
+    if not text or text[0] not in "PCpc":
+        return False
+    return bool(_STRUCTURAL_MARKER_RE.match(text))
 
 
+@lru_cache(maxsize=4096)
 def _is_level1_structural(text: str) -> bool:
     """Any structural marker that should be level 1 (includes APPENDIX etc.)."""
-    return bool(_LEVEL1_STRUCTURAL_RE.match(text.strip()))
+    text = text.strip()
+    if not text or text[0] not in "PCAEpcae":
+        return False
+    return bool(_LEVEL1_STRUCTURAL_RE.match(text))
 
 
 # ---------------------------------------------------------------------------
@@ -631,6 +794,29 @@ def _is_level1_structural(text: str) -> bool:
 _COMPOUND_SEP_RE = re.compile(r"\s+[·•]\s+")
 
 
+def _split_compound_heading(el: HeadingBlock) -> Optional[ParagraphBlock]:
+    """Split one heading merged via middle-dot/bullet separators.
+
+    Mutates the heading to keep only the part before the separator and
+    returns the remainder as a ParagraphBlock, or None if the heading has
+    no separator.
+    """
+    text = el.text
+    # memchr-level prefilter: almost no headings contain a middle dot or
+    # bullet, so skip the regex search unless one is present
+    if "·" not in text and "•" not in text:
+        return None
+    parts = _COMPOUND_SEP_RE.split(text, maxsplit=1)
+    if len(parts) == 1:
+        return None
+    el.text = parts[0].strip()
+    el.runs = []  # clear stale runs
+    el.confidence = min(el.confidence, 0.75)
+    prev = el.classification_reason or "unknown"
+    el.classification_reason = sys.intern(f"{prev}; compound_split")
+    return ParagraphBlock(text=parts[1].strip(), page=el.page)
+
+
 def _split_compound_headings(elements: list) -> list:
     """Split headings that Docling merged via middle-dot/bullet separators.
 
@@ -638,20 +824,19 @@ def _split_compound_headings(elements: list) -> list:
     - HeadingBlock("PAY APPLICATIONS")
     - ParagraphBlock("Managed in Aconex")
     """
-    result = []
-    for el in elements:
-        if isinstance(el, HeadingBlock) and _COMPOUND_SEP_RE.search(el.text):
-            parts = _COMPOUND_SEP_RE.split(el.text, maxsplit=1)
-            el.text = parts[0].strip()
-            el.runs = []  # clear stale runs
-            el.confidence = min(el.confidence, 0.75)
-            prev = el.classification_reason or "unknown"
-            el.classification_reason = f"{prev}; compound_split"
-            result.append(el)
-            result.append(ParagraphBlock(text=parts[1].strip(), page=el.page))
-        else:
+    # Lazy copy-on-write: most documents have no compound headings, so
+    # the input list is returned as-is unless a split actually happens
+    result = None
+    for i, el in enumerate(elements):
+        if result is not None:
             result.append(el)
-    return result
+        if type(el) is HeadingBlock:
+            trailing = _split_compound_heading(el)
+            if trailing is not None:
+                if result is None:
+                    result = elements[: i + 1]
+                result.append(trailing)
+    return result if result is not None else elements
 
 
 # ---------------------------------------------------------------------------
@@ -661,9 +846,8 @@ def _split_compound_headings(elements: list) -> list:
 _MULTI_LEVEL_NUMBER_RE = re.compile(r"^(\d+(?:\.\d+)+)\.?\s+\S")
 
 
-def _promote_numbered_paragraphs(elements: list) -> list:
-    """Promote ParagraphBlocks starting with multi-level numbering (2+ parts)
-    to HeadingBlock. Catches items Docling misclassified as text.
+def _promote_numbered(el, reason_prefix: str, high_conf: float, low_conf: float) -> Optional[HeadingBlock]:
+    """Promote one numbered paragraph/list item to a heading, or None.
 
     Only multi-level numbers (e.g. 1.1, 1.2.3) are promoted — single-level
     numbers (e.g. "1. something") are left alone to avoid false positives.
@@ -672,34 +856,50 @@ def _promote_numbered_paragraphs(elements: list) -> list:
     unambiguous section markers. For 2-part numbers (e.g. 1.2) the 120-char
     limit is kept to avoid false positives like "1.2 billion dollars...".
     """
-    result = []
-    for el in elements:
-        if isinstance(el, ParagraphBlock):
-            match = _MULTI_LEVEL_NUMBER_RE.match(el.text)
-            if match:
-                parts_count = len(match.group(1).split("."))
-                if parts_count >= 3:
-                    conf = 0.90
-                    reason = f"promoted:multi_level_{parts_count}_parts"
-                elif len(el.text) < 120:
-                    conf = 0.70
-                    reason = f"promoted:two_level_{len(el.text)}_chars"
-                else:
-                    result.append(el)
-                    continue
-                result.append(
-                    HeadingBlock(
-                        level=2,  # placeholder, resolved later
-                        text=el.text,
-                        page=el.page,
-                        runs=el.runs,
-                        confidence=conf,
-                        classification_reason=reason,
-                    )
-                )
+    text = el.text
+    # The pattern anchors on a digit — bail out on the first byte for the
+    # vast majority of blocks that aren't numbered
+    if not text or not ("0" <= text[0] <= "9"):
+        return None
+    match = _MULTI_LEVEL_NUMBER_RE.match(text)
+    if not match:
+        return None
+    parts_count = len(match.group(1).split("."))
+    if parts_count >= 3:
+        conf = high_conf
+        reason = f"{reason_prefix}:multi_level_{parts_count}_parts"
+    elif len(el.text) < 120:
+        conf = low_conf
+        reason = f"{reason_prefix}:two_level_{len(el.text)}_chars"
+    else:
+        return None
+    return HeadingBlock(
+        level=2,  # placeholder, resolved later
+        text=el.text,
+        page=el.page,
+        runs=el.runs,
+        confidence=conf,
+        classification_reason=sys.intern(reason),
+    )
+
+
+def _promote_numbered_paragraphs(elements: list) -> list:
+    """Promote ParagraphBlocks starting with multi-level numbering (2+ parts)
+    to HeadingBlock. Catches items Docling misclassified as text.
+    """
+    # Lazy copy-on-write: unchanged inputs come back as the same list
+    result = None
+    for i, el in enumerate(elements):
+        if type(el) is ParagraphBlock:
+            promoted = _promote_numbered(el, "promoted", 0.90, 0.70)
+            if promoted is not None:
+                if result is None:
+                    result = elements[:i]
+                result.append(promoted)
                 continue
-        result.append(el)
-    return result
+        if result is not None:
+            result.append(el)
+    return result if result is not None else elements
 
 
 # ---------------------------------------------------------------------------
@@ -713,34 +913,67 @@ def _promote_numbered_list_items(elements: list) -> list:
     as list items rather than headings. This catches them the same way
     _promote_numbered_paragraphs catches misclassified paragraphs.
     """
-    result = []
-    for el in elements:
-        if isinstance(el, _PendingListItem):
-            match = _MULTI_LEVEL_NUMBER_RE.match(el.text)
-            if match:
-                parts_count = len(match.group(1).split("."))
-                if parts_count >= 3:
-                    conf = 0.85
-                    reason = f"promoted_list_item:multi_level_{parts_count}_parts"
-                elif len(el.text) < 120:
-                    conf = 0.65
-                    reason = f"promoted_list_item:two_level_{len(el.text)}_chars"
-                else:
-                    result.append(el)
-                    continue
-                result.append(
-                    HeadingBlock(
-                        level=2,  # placeholder, resolved later
-                        text=el.text,
-                        page=el.page,
-                        runs=el.runs,
-                        confidence=conf,
-                        classification_reason=reason,
-                    )
-                )
+    # Lazy copy-on-write: unchanged inputs come back as the same list
+    result = None
+    for i, el in enumerate(elements):
+        if type(el) is _PendingListItem:
+            promoted = _promote_numbered(el, "promoted_list_item", 0.85, 0.65)
+            if promoted is not None:
+                if result is None:
+                    result = elements[:i]
+                result.append(promoted)
                 continue
-        result.append(el)
-    return result
+        if result is not None:
+            result.append(el)
+    return result if result is not None else elements
+
+
+def _apply_block_transforms(elements: list) -> tuple[list, list[int]]:
+    """Run the per-element rewrite passes in a single traversal.
+
+    Equivalent to _split_compound_headings → _promote_numbered_paragraphs
+    → _promote_numbered_list_items run back to back, but building one
+    output list instead of three — the intermediate lists were pure
+    allocation overhead on large documents. The paragraph split off a
+    compound heading is checked for promotion, matching the sequential
+    order of the original passes.
+
+    Returns the rewritten list plus the indices of its HeadingBlocks, so
+    level resolution can iterate only headings instead of every element.
+    Until the first actual rewrite the output is the input list itself
+    (lazy copy-on-write) — on the common document with no compound
+    headings and no misnumbered blocks, no copy is made at all.
+    """
+    result = None  # materialized on the first rewrite
+    heading_indices: list[int] = []
+    mark_heading = heading_indices.append
+    for i, el in enumerate(elements):
+        el_type = type(el)
+        if el_type is HeadingBlock:
+            # While unchanged, output index == input index
+            mark_heading(i if result is None else len(result))
+            if result is not None:
+                result.append(el)
+            el = _split_compound_heading(el)
+            if el is None:
+                continue
+            if result is None:
+                result = elements[: i + 1]
+            el_type = ParagraphBlock
+        if el_type is ParagraphBlock:
+            promoted = _promote_numbered(el, "promoted", 0.90, 0.70)
+        elif el_type is _PendingListItem:
+            promoted = _promote_numbered(el, "promoted_list_item", 0.85, 0.65)
+        else:
+            promoted = None
+        if promoted is not None:
+            if result is None:
+                result = elements[:i]
+            mark_heading(len(result))
+            result.append(promoted)
+        elif result is not None:
+            result.append(el)
+    return (result if result is not None else elements), heading_indices
 
 
 # ---------------------------------------------------------------------------
@@ -748,10 +981,14 @@ def _promote_numbered_list_items(elements: list) -> list:
 # ---------------------------------------------------------------------------
 
 
-def _resolve_heading_levels(elements: list, has_parts: bool) -> None:
+def _resolve_heading_levels(
+    elements: list, has_parts: bool, heading_indices: Optional[list[int]] = None
+) -> None:
     """Assign heading levels based on text content only.
 
-    Mutates HeadingBlock.level in-place.
+    Mutates HeadingBlock.level in-place. When heading_indices (positions
+    of the HeadingBlocks in elements) is given, only those entries are
+    visited — resolution never looks at other block types.
 
     Rules (in priority order):
     1. Structural markers (PART, APPENDIX, etc.) → level 1
@@ -763,10 +1000,12 @@ def _resolve_heading_levels(elements: list, has_parts: bool) -> None:
     first_heading_seen = False
     last_level = 2
 
-    for el in elements:
-        if not isinstance(el, HeadingBlock):
-            continue
+    if heading_indices is not None:
+        headings = (elements[i] for i in heading_indices)
+    else:
+        headings = (el for el in elements if type(el) is HeadingBlock)
 
+    for el in headings:
         level_reason: str
         if _is_level1_structural(el.text):
             el.level = 1
@@ -786,10 +1025,14 @@ def _resolve_heading_levels(elements: list, has_parts: bool) -> None:
                 el.confidence = min(el.confidence, 0.50)
                 level_reason = f"inherited_{last_level}"
 
+        # Interned: the same reason chain repeats across many headings,
+        # so identical strings collapse to one object
         if el.classification_reason:
-            el.classification_reason += f"; level:{level_reason}"
+            el.classification_reason = sys.intern(
+                f"{el.classification_reason}; level:{level_reason}"
+            )
         else:
-            el.classification_reason = f"level:{level_reason}"
+            el.classification_reason = sys.intern(f"level:{level_reason}")
 
         last_level = el.level
         first_heading_seen = True
@@ -799,6 +1042,12 @@ def _resolve_heading_levels(elements: list, has_parts: bool) -> None:
 # List grouping
 # ---------------------------------------------------------------------------
 
+# Roman numeral tokens recognized in list markers (i. through x.)
+_ROMAN_TOKENS = frozenset(
+    {"i", "ii", "iii", "iv", "v", "vi", "vii", "viii", "ix", "x"}
+)
+
+
 def _detect_marker_format(items: list[_PendingListItem]) -> Optional[str]:
     """Detect the numbering format from list item markers.
 
@@ -808,23 +1057,22 @@ def _detect_marker_format(items: list[_PendingListItem]) -> Optional[str]:
     - i. / ii. / iii. / iv. → "lowerRoman"
     - I. / II. / III. → "upperRoman"
     - else → None (default decimal)
-    """
-    _LOWER_LETTER_RE = re.compile(r"^[a-z][.)]")
-    _UPPER_LETTER_RE = re.compile(r"^[A-Z][.)]")
-    _LOWER_ROMAN_RE = re.compile(r"^(?:i{1,3}|iv|vi{0,3}|ix|x)[.)]", re.IGNORECASE)
 
-    for item in items[:3]:
+    Markers are 1-3 characters, so plain string checks beat regex engine
+    setup: a set lookup for roman tokens and character tests for letters.
+    """
+    # islice avoids materializing a 3-element slice copy per list
+    for item in itertools.islice(items, 3):
         m = item.marker.strip()
         if not m:
             continue
-        if _LOWER_ROMAN_RE.match(m) and m[0].islower():
-            return "lowerRoman"
-        if _LOWER_LETTER_RE.match(m):
-            return "lowerLetter"
-        if _LOWER_ROMAN_RE.match(m) and m[0].isupper():
-            return "upperRoman"
-        if _UPPER_LETTER_RE.match(m):
-            return "upperLetter"
+        if len(m) < 2 or m[-1] not in ".)":
+            return None
+        head = m[:-1]
+        if head.lower() in _ROMAN_TOKENS:
+            return "lowerRoman" if head.islower() else "upperRoman"
+        if len(head) == 1 and head.isascii() and head.isalpha():
+            return "lowerLetter" if head.islower() else "upperLetter"
         # Has a marker but didn't match letter/roman → decimal
         return None
     return None
@@ -833,64 +1081,77 @@ def _detect_marker_format(items: list[_PendingListItem]) -> Optional[str]:
 def _group_list_items(elements: list) -> list[IRBlock]:
     """Group consecutive _PendingListItem into ListBlock with nested items.
 
-    Uses nesting_depth to create the list hierarchy.
+    Single pass: each pending item is nested into the open list as it
+    arrives, using nesting_depth and a parallel-list ancestor stack (no
+    tuple per item; the depth peek is an int compare; each item is pushed
+    and popped at most once). The old shape accumulated a flat pending
+    list that marker detection and a nesting pass then re-walked. A dense
+    depth-indexed parent array doesn't fit here: Docling emits sparse and
+    occasionally decreasing nesting depths, and the parent is the nearest
+    *shallower* ancestor, not depth - 1.
+
+    Lazy copy-on-write: a document with no list items gets its input
+    list back unchanged instead of a full copy.
     """
-    result: list[IRBlock] = []
-    pending: list[_PendingListItem] = []
+    result: Optional[list[IRBlock]] = None
 
-    def flush_pending():
-        if not pending:
+    # State of the currently open list run
+    root_items: list[ListItem] = []
+    depths: list[int] = []
+    parents: list[ListItem] = []
+    samples: list[_PendingListItem] = []  # first 3, for marker detection
+    first: Optional[_PendingListItem] = None
+    base_depth = 0
+
+    def flush():
+        nonlocal first, root_items, depths, parents, samples
+        if first is None:
             return
-        # Determine if ordered based on first item
-        ordered = pending[0].enumerated
-        style = "ordered" if ordered else "unordered"
-        page = pending[0].page
-
-        marker_format = _detect_marker_format(pending) if ordered else None
-        items = _nest_list_items(pending)
+        ordered = first.enumerated
         result.append(ListBlock(
-            style=style, items=items, page=page, marker_format=marker_format,
+            style="ordered" if ordered else "unordered",
+            items=root_items,
+            page=first.page,
+            marker_format=_detect_marker_format(samples) if ordered else None,
         ))
-        pending.clear()
-
-    for el in elements:
-        if isinstance(el, _PendingListItem):
-            pending.append(el)
-        else:
-            flush_pending()
-            result.append(el)
-
-    flush_pending()
-    return result
-
-
-def _nest_list_items(pending: list[_PendingListItem]) -> list[ListItem]:
-    """Convert flat pending items with nesting_depth into nested ListItems."""
-    if not pending:
-        return []
-
-    root_items: list[ListItem] = []
-    # Stack of (depth, ListItem)
-    stack: list[tuple[int, ListItem]] = []
-
-    base_depth = pending[0].nesting_depth
-
-    for p in pending:
-        li = ListItem(text=p.text, runs=p.runs)
-        depth = p.nesting_depth - base_depth
-
-        # Pop stack until we find a parent at a lower depth
-        while stack and stack[-1][0] >= depth:
-            stack.pop()
+        first = None
+        root_items = []
+        depths = []
+        parents = []
+        samples = []
+
+    for i, el in enumerate(elements):
+        if type(el) is _PendingListItem:
+            if result is None:
+                result = elements[:i]
+            if first is None:
+                first = el
+                base_depth = el.nesting_depth
+            if len(samples) < 3:
+                samples.append(el)
+
+            li = ListItem(text=el.text, runs=el.runs)
+            depth = el.nesting_depth - base_depth
+
+            # Pop until we find a parent at a lower depth
+            while depths and depths[-1] >= depth:
+                depths.pop()
+                parents.pop()
+
+            if parents:
+                parents[-1].children.append(li)
+            else:
+                root_items.append(li)
 
-        if stack:
-            stack[-1][1].children.append(li)
+            depths.append(depth)
+            parents.append(li)
         else:
-            root_items.append(li)
-
-        stack.append((depth, li))
+            flush()
+            if result is not None:
+                result.append(el)
 
-    return root_items
+    flush()
+    return result if result is not None else elements
 
 
 # ---------------------------------------------------------------------------
@@ -915,29 +1176,44 @@ def _build_heading_tree(flat_elements: list[IRBlock]) -> list[IRBlock]:
     if not flat_elements:
         return []
 
-    # Stack of (level, block) — level=0 means root
-    root: list[IRBlock] = []
-    # Stack tracks the current heading chain: [(level, heading_block), ...]
-    stack: list[tuple[int, HeadingBlock]] = []
-
-    for block in flat_elements:
-        if isinstance(block, HeadingBlock):
-            # Pop stack until we find a heading with a strictly lower level
-            while stack and stack[-1][0] >= block.level:
-                stack.pop()
-
-            if stack:
+    # Everything before the first heading lands at root unchanged, so skip
+    # straight to it — and a document with no headings is already its tree.
+    n = len(flat_elements)
+    first = 0
+    while first < n and type(flat_elements[first]) is not HeadingBlock:
+        first += 1
+    if first == n:
+        return list(flat_elements)
+
+    root: list[IRBlock] = flat_elements[:first]
+    # The current heading chain as parallel lists — no tuple allocation
+    # per heading, and the level peek is a plain int compare
+    levels: list[int] = []
+    parents: list[HeadingBlock] = []
+
+    for block in itertools.islice(flat_elements, first, None):
+        # Exact-type check (pointer compare): IR block types are never
+        # subclassed, and this loop runs for every block in the document
+        if type(block) is HeadingBlock:
+            # Pop until we find a heading with a strictly lower level
+            level = block.level
+            while levels and levels[-1] >= level:
+                levels.pop()
+                parents.pop()
+
+            if parents:
                 # Nest under the parent heading
-                stack[-1][1].children.append(block)
+                parents[-1].children.append(block)
             else:
                 # Top-level heading
                 root.append(block)
 
-            stack.append((block.level, block))
+            levels.append(level)
+            parents.append(block)
         else:
             # Non-heading: add as child of current heading, or root
-            if stack:
-                stack[-1][1].children.append(block)
+            if parents:
+                parents[-1].children.append(block)
             else:
                 root.append(block)
 
@@ -2,11 +2,25 @@
 
 from __future__ import annotations
 
+import functools
+
 from pdf_converter.config import Config
 from pdf_converter.exceptions import ConfigError
 from pdf_converter.parsers.base import BasePdfParser
 
 
+@functools.lru_cache(maxsize=4)
+def _resolve_parser_class(engine: str) -> type[BasePdfParser]:
+    """Resolve an engine name to its parser class, caching the import."""
+    if engine == "docling":
+        from pdf_converter.parsers.docling_parser import DoclingParser
+
+        return DoclingParser
+    raise ConfigError(
+        f"Unknown parser engine: '{engine}'. Available: docling"
+    )
+
+
 def create_parser(config: Config | None = None) -> BasePdfParser:
     """Create a parser instance based on config.
 
@@ -20,13 +34,5 @@ def create_parser(config: Config | None = None) -> BasePdfParser:
         ConfigError: If the configured engine is unknown.
     """
     config = config or Config.default()
-    engine = config.parser.engine.lower()
-
-    if engine == "docling":
-        from pdf_converter.parsers.docling_parser import DoclingParser
-
-        return DoclingParser(config)
-    else:
-        raise ConfigError(
-            f"Unknown parser engine: '{engine}'. Available: docling"
-        )
+    parser_cls = _resolve_parser_class(config.parser.engine.lower())
+    return parser_cls(config)
@@ -8,12 +8,13 @@ from __future__ import annotations
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
 from pdf_converter.config import Config
 from pdf_converter.exceptions import GenerationError, ParseError
-from pdf_converter.generators.word_generator import WordGenerator
 from pdf_converter.ir.report import ConversionReport
 from pdf_converter.ir.schema import DocumentIR
 from pdf_converter.parsers.factory import create_parser
@@ -21,13 +22,36 @@ from pdf_converter.parsers.factory import create_parser
 logger = logging.getLogger(__name__)
 
 
+def _as_path(p: Path | str) -> Path:
+    """Coerce to Path without re-parsing values that already are one."""
+    return p if isinstance(p, Path) else Path(p)
+
+
 class Pipeline:
-    """Orchestrates PDF → IR → Word conversion."""
+    """Orchestrates PDF → IR → Word conversion.
+
+    The parser and generator are constructed once per Pipeline and reused
+    across calls, so batch loops don't pay their setup per document.
+    Configure before the first conversion — config changes afterwards are
+    not picked up by the cached stages.
+    """
 
     def __init__(self, config: Config | None = None):
         self.config = config or Config.default()
         self.last_report: ConversionReport | None = None
 
+    @cached_property
+    def _parser(self):
+        return create_parser(self.config)
+
+    @cached_property
+    def _generator(self):
+        # Deferred: WordGenerator pulls in python-docx (lxml + bundled
+        # stylesheets), which parse-only flows never need to pay for.
+        from pdf_converter.generators.word_generator import WordGenerator
+
+        return WordGenerator(self.config)
+
     def convert(
         self,
         pdf_path: Path,
@@ -36,6 +60,7 @@ class Pipeline:
         ir_path: Path | None = None,
         save_report: bool = False,
         report_path: Path | None = None,
+        build_report: bool = True,
     ) -> Path:
         """Full pipeline: PDF → IR → .docx.
 
@@ -46,17 +71,21 @@ class Pipeline:
             ir_path: Custom path for IR JSON. Defaults to {output_stem}.ir.json.
             save_report: Whether to save a conversion report JSON.
             report_path: Custom path for report JSON. Defaults to {output_stem}.report.json.
+            build_report: Whether to walk the IR for block statistics.
+                Pass False in throughput-sensitive loops that never read
+                last_report's counts; timings are recorded either way.
 
         Returns:
             Path to the generated .docx file.
         """
-        pdf_path = Path(pdf_path)
-        output_path = Path(output_path)
+        pdf_path = _as_path(pdf_path)
+        output_path = _as_path(output_path)
 
-        # Stage 1: Parse
-        t0 = time.monotonic()
+        # Stage 1: Parse (perf_counter_ns: integer reads, no float
+        # rounding until the report is built)
+        t0 = time.perf_counter_ns()
         ir = self.parse(pdf_path)
-        t1 = time.monotonic()
+        t1 = time.perf_counter_ns()
 
         # Optional: save IR checkpoint
         if save_ir:
@@ -65,15 +94,21 @@ class Pipeline:
             self.save_ir(ir, ir_path)
 
         # Stage 2: Generate
-        t2 = time.monotonic()
+        t2 = time.perf_counter_ns()
         result = self.generate(ir, output_path, base_dir=pdf_path.parent)
-        t3 = time.monotonic()
-
-        # Build report
-        report = ConversionReport.from_ir(ir)
-        report.parse_time_seconds = t1 - t0
-        report.generate_time_seconds = t3 - t2
-        report.total_time_seconds = t3 - t0
+        t3 = time.perf_counter_ns()
+
+        # Build report — the IR walk is skipped when nobody will read it
+        if build_report or save_report:
+            report = ConversionReport.from_ir(ir)
+        else:
+            report = ConversionReport(
+                source_file=ir.metadata.source_file,
+                page_count=ir.metadata.page_count,
+            )
+        report.parse_time_seconds = (t1 - t0) / 1e9
+        report.generate_time_seconds = (t3 - t2) / 1e9
+        report.total_time_seconds = (t3 - t0) / 1e9
         self.last_report = report
 
         # Optional: save report
@@ -85,6 +120,50 @@ class Pipeline:
 
         return result
 
+    def convert_many(
+        self,
+        pairs: list[tuple[Path, Path]],
+        max_workers: int = 2,
+    ) -> list[Path]:
+        """Convert a batch of PDFs, overlapping parsing with generation.
+
+        While the main thread generates document i, a worker thread
+        already parses document i+1 — parser IO/inference and docx
+        writing overlap instead of running back to back. Only one parse
+        runs ahead at a time, so at most two IRs are held in memory.
+
+        Args:
+            pairs: (pdf_path, output_path) tuples, converted in order.
+            max_workers: Size of the parse worker pool.
+
+        Returns:
+            Output paths in the same order as ``pairs``.
+
+        Note:
+            Unlike :meth:`convert`, no per-document report is built and
+            ``last_report`` is left untouched.
+        """
+        pairs = [(_as_path(pdf), _as_path(out)) for pdf, out in pairs]
+        results: list[Path] = []
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pdfconv-parse"
+        ) as pool:
+            future = None
+            for i, (pdf_path, output_path) in enumerate(pairs):
+                if future is None:
+                    future = pool.submit(self.parse, pdf_path)
+                ir = future.result()
+                # Kick off the next parse before generating this document
+                future = (
+                    pool.submit(self.parse, pairs[i + 1][0])
+                    if i + 1 < len(pairs)
+                    else None
+                )
+                results.append(
+                    self.generate(ir, output_path, base_dir=pdf_path.parent)
+                )
+        return results
+
     def parse(self, pdf_path: Path) -> DocumentIR:
         """Stage 1: Parse a PDF to IR.
 
@@ -94,11 +173,10 @@ class Pipeline:
         Returns:
             The parsed DocumentIR.
         """
-        pdf_path = Path(pdf_path)
+        pdf_path = _as_path(pdf_path)
         logger.info("Parsing %s", pdf_path)
 
-        parser = create_parser(self.config)
-        return parser.parse(pdf_path)
+        return self._parser.parse(pdf_path)
 
     def generate(
         self,
@@ -116,11 +194,10 @@ class Pipeline:
         Returns:
             Path to the generated .docx file.
         """
-        output_path = Path(output_path)
+        output_path = _as_path(output_path)
         logger.info("Generating %s", output_path)
 
-        generator = WordGenerator(self.config)
-        return generator.generate(ir, output_path, base_dir)
+        return self._generator.generate(ir, output_path, base_dir)
 
     def inspect(self, pdf_path: Path) -> str:
         """Parse PDF and return IR as formatted JSON string.
@@ -148,13 +225,14 @@ class Pipeline:
         Returns:
             Path to the generated .docx file.
         """
-        ir_path = Path(ir_path)
-        output_path = Path(output_path)
+        ir_path = _as_path(ir_path)
+        output_path = _as_path(output_path)
 
         logger.info("Loading IR from %s", ir_path)
         try:
-            json_str = ir_path.read_text(encoding="utf-8")
-            ir = DocumentIR.from_json(json_str)
+            # Raw bytes: the JSON parser decodes UTF-8 itself, so there's
+            # no point paying read_text's full decode pass first
+            ir = DocumentIR.from_json(ir_path.read_bytes())
         except FileNotFoundError:
             raise ParseError(f"IR file not found: {ir_path}")
         except Exception as exc:
@@ -173,7 +251,7 @@ class Pipeline:
         Returns:
             The path written to.
         """
-        path = Path(path)
+        path = _as_path(path)
         logger.info("Saving IR to %s", path)
-        path.write_text(ir.to_json(), encoding="utf-8")
+        ir.dump_json_to(path)
         return path
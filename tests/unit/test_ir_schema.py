@@ -122,35 +122,43 @@ def _sample_document() -> DocumentIR:
     )
 
 
+@pytest.fixture(scope="module")
+def sample_document() -> DocumentIR:
+    """One shared sample IR per module — tests only read it."""
+    return _sample_document()
+
+
+@pytest.fixture(scope="module")
+def sample_json(sample_document) -> str:
+    """The sample IR serialized once — round-trip tests parse the same string."""
+    return sample_document.to_json()
+
+
 # ---------------------------------------------------------------------------
 # Round-trip serialization
 # ---------------------------------------------------------------------------
 
 class TestIRSerialization:
-    def test_round_trip_json(self):
+    def test_round_trip_json(self, sample_json):
         """DocumentIR → JSON → DocumentIR preserves all data."""
-        doc = _sample_document()
-        json_str = doc.to_json()
-        restored = DocumentIR.from_json(json_str)
+        restored = DocumentIR.from_json(sample_json)
 
         assert restored.metadata.source_file == "requirements.pdf"
         assert restored.metadata.page_count == 5
         assert len(restored.body) == 3  # 2 headings + 1 page break
         assert len(restored.furniture) == 2
 
-    def test_json_is_valid(self):
+    def test_json_is_valid(self, sample_json):
         """to_json() produces valid JSON."""
-        doc = _sample_document()
-        data = json.loads(doc.to_json())
+        data = json.loads(sample_json)
         assert isinstance(data, dict)
         assert "metadata" in data
         assert "body" in data
         assert "furniture" in data
 
-    def test_round_trip_preserves_tree_structure(self):
+    def test_round_trip_preserves_tree_structure(self, sample_json):
         """Heading children survive serialization."""
-        doc = _sample_document()
-        restored = DocumentIR.from_json(doc.to_json())
+        restored = DocumentIR.from_json(sample_json)
 
         h1 = restored.body[0]
         assert h1.type == "heading"
@@ -162,10 +170,9 @@ class TestIRSerialization:
         assert h2.level == 2
         assert len(h2.children) == 3  # list + table + figure
 
-    def test_round_trip_preserves_runs(self):
+    def test_round_trip_preserves_runs(self, sample_json):
         """TextRuns with formatting survive serialization."""
-        doc = _sample_document()
-        restored = DocumentIR.from_json(doc.to_json())
+        restored = DocumentIR.from_json(sample_json)
 
         p1 = restored.body[0].children[0]
         assert p1.type == "paragraph"
@@ -173,10 +180,9 @@ class TestIRSerialization:
         assert p1.runs[1].bold is True
         assert p1.runs[1].text == "requirements"
 
-    def test_round_trip_preserves_nested_list(self):
+    def test_round_trip_preserves_nested_list(self, sample_json):
         """Nested list items survive serialization."""
-        doc = _sample_document()
-        restored = DocumentIR.from_json(doc.to_json())
+        restored = DocumentIR.from_json(sample_json)
 
         list_block = restored.body[0].children[1].children[0]
         assert list_block.type == "list"
@@ -184,10 +190,9 @@ class TestIRSerialization:
         assert len(list_block.items[1].children) == 2
         assert list_block.items[1].children[0].text == "Sub-item B1"
 
-    def test_round_trip_preserves_table(self):
+    def test_round_trip_preserves_table(self, sample_json):
         """Table cells survive serialization."""
-        doc = _sample_document()
-        restored = DocumentIR.from_json(doc.to_json())
+        restored = DocumentIR.from_json(sample_json)
 
         table = restored.body[0].children[1].children[1]
         assert table.type == "table"
@@ -196,10 +201,9 @@ class TestIRSerialization:
         assert len(table.cells) == 4
         assert table.cells[0].text == "Header 1"
 
-    def test_round_trip_preserves_furniture(self):
+    def test_round_trip_preserves_furniture(self, sample_json):
         """Furniture items survive serialization."""
-        doc = _sample_document()
-        restored = DocumentIR.from_json(doc.to_json())
+        restored = DocumentIR.from_json(sample_json)
 
         assert restored.furniture[0].type == FurnitureType.HEADER
         assert restored.furniture[0].text == "ACME Corp — Confidential"
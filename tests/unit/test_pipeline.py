@@ -118,6 +118,25 @@ class TestPipelineConvert:
         assert out.exists()
         assert (tmp_path / "output.ir.json").exists()
 
+    @patch("pdf_converter.pipeline.create_parser")
+    def test_convert_many(self, mock_factory, tmp_path):
+        """Batch conversion produces one output per pair, in order."""
+        mock_parser = MagicMock()
+        mock_parser.parse.return_value = _simple_ir()
+        mock_factory.return_value = mock_parser
+
+        pipeline = Pipeline()
+        pairs = []
+        for i in range(3):
+            pdf = tmp_path / f"input_{i}.pdf"
+            pdf.write_bytes(b"%PDF-fake")
+            pairs.append((pdf, tmp_path / f"output_{i}.docx"))
+
+        results = pipeline.convert_many(pairs)
+        assert results == [out for _, out in pairs]
+        assert all(out.exists() for _, out in pairs)
+        assert mock_parser.parse.call_count == 3
+
 
 # ---------------------------------------------------------------------------
 # CLI tests
@@ -23,14 +23,16 @@ from pdf_converter.ir.schema import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def generator():
+    """One shared default-config generator — it keeps no state between
+    generate calls, so every test can reuse it."""
     return WordGenerator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def simple_ir():
-    """A simple IR with a heading and paragraph."""
+    """A simple IR with a heading and paragraph (tests only read it)."""
     return DocumentIR(
         metadata=DocumentMetadata(title="Test Doc"),
         body=[
@@ -96,10 +98,12 @@ class TestHeadings:
             HeadingBlock(level=3, text="L3"),
         ])
         doc = generator.generate_document(ir)
-        # Check style names include the level
-        assert "Heading 1" in doc.paragraphs[0].style.name
-        assert "Heading 2" in doc.paragraphs[1].style.name
-        assert "Heading 3" in doc.paragraphs[2].style.name
+        # Check style names include the level (doc.paragraphs re-walks the
+        # body XML per access, so materialize it once)
+        paras = doc.paragraphs
+        assert "Heading 1" in paras[0].style.name
+        assert "Heading 2" in paras[1].style.name
+        assert "Heading 3" in paras[2].style.name
 
     def test_heading_always_uses_configured_style(self, generator):
         """Headings must always use doc.add_paragraph(style=...), never doc.add_heading()."""
@@ -111,8 +115,9 @@ class TestHeadings:
         ])
         doc = generator.generate_document(ir)
         # Both should use Heading style
-        assert "Heading 1" in doc.paragraphs[0].style.name
-        assert "Heading 2" in doc.paragraphs[1].style.name
+        paras = doc.paragraphs
+        assert "Heading 1" in paras[0].style.name
+        assert "Heading 2" in paras[1].style.name
 
 
 # ---------------------------------------------------------------------------
@@ -252,10 +257,10 @@ class TestLists:
             ]),
         ])
         doc = generator.generate_document(ir)
-        texts = [p.text for p in doc.paragraphs]
-        assert texts == ["Item A", "Item B", "Item C"]
+        paras = doc.paragraphs
+        assert [p.text for p in paras] == ["Item A", "Item B", "Item C"]
         # All should use List Bullet style
-        for p in doc.paragraphs:
+        for p in paras:
             assert "List Bullet" in p.style.name
 
     def test_ordered_list(self, generator):
@@ -266,9 +271,9 @@ class TestLists:
             ]),
         ])
         doc = generator.generate_document(ir)
-        texts = [p.text for p in doc.paragraphs]
-        assert texts == ["First", "Second"]
-        for p in doc.paragraphs:
+        paras = doc.paragraphs
+        assert [p.text for p in paras] == ["First", "Second"]
+        for p in paras:
             assert "List Number" in p.style.name
 
     def test_nested_list(self, generator):
@@ -402,6 +407,37 @@ class TestTables:
         # Merged cell should contain the text
         assert table.cell(0, 0).text == "Span 2 cols"
 
+    def test_overlapping_spans_degrade_gracefully(self, generator):
+        """Overlapping spans (Docling emits them) must not abort generation."""
+        ir = DocumentIR(body=[
+            # A vertical span crossing an already-merged horizontal span:
+            # the second merge fails inside python-docx and must be skipped,
+            # keeping the cell text in the unmerged origin.
+            TableBlock(
+                num_rows=4,
+                num_cols=4,
+                cells=[
+                    TableCell(row=1, col=0, text="wide", col_span=3),
+                    TableCell(row=0, col=1, text="tall", row_span=3),
+                ],
+            ),
+            # Span whose target lands on an already-merged position —
+            # crashed on the stale cell snapshot before re-resolving.
+            TableBlock(
+                num_rows=4,
+                num_cols=4,
+                cells=[
+                    TableCell(row=3, col=2, text="wide", col_span=2),
+                    TableCell(row=2, col=3, text="tall", row_span=2),
+                ],
+            ),
+        ])
+        doc = generator.generate_document(ir)
+        table = doc.tables[0]
+        assert table.cell(1, 0).text == "wide"
+        assert table.cell(0, 1).text == "tall"
+        assert len(doc.tables) == 2
+
     def test_empty_table(self, generator):
         ir = DocumentIR(body=[
             TableBlock(num_rows=0, num_cols=0, cells=[]),